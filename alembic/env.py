@@ -61,6 +61,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -81,8 +82,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Each revision runs in its own transaction: the table DDL of a
+        # revision commits atomically, and revisions that build indexes
+        # CONCURRENTLY only need to leave their own transaction.
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,63 @@
+"""add_mission_and_expense_check_constraints
+
+Revision ID: a1c3e5f7b9d2
+Revises: f4b6d8e0a2c3
+Create Date: 2026-10-16 00:00:00.000000
+
+Adds missions_date_range and expenses_amount_positive to databases created
+before a3a97102969e declared them, so the schema matches the models.
+Databases created since then already have them and are left alone.
+
+Each constraint is added NOT VALID (a brief lock; only new writes are
+checked) and then validated in its own transaction, which scans the table
+without blocking writes. Validation fails if existing rows violate it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b9d2'
+down_revision: Union[str, Sequence[str], None] = 'f4b6d8e0a2c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (constraint name, table, check expression)
+CONSTRAINTS = (
+    (
+        "missions_date_range",
+        "missions",
+        "end_date IS NULL OR start_date IS NULL OR end_date >= start_date",
+    ),
+    ("expenses_amount_positive", "expenses", "amount > 0"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add missing CHECK constraints."""
+    bind = op.get_bind()
+    existing = frozenset(
+        bind.exec_driver_sql(
+            "SELECT conname FROM pg_constraint WHERE conname IN ("
+            + ", ".join(f"'{name}'" for name, _, _ in CONSTRAINTS)
+            + ")"
+        ).scalars().all()
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, check in CONSTRAINTS:
+            if name in existing:
+                continue
+            op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({check}) NOT VALID")
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Nothing to undo.
+
+    a3a97102969e declares these constraints for new databases, so they are
+    kept to match it and the models.
+    """
+    pass
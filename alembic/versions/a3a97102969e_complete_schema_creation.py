@@ -12,13 +12,16 @@ It includes:
 - Expenses (financial tracking)
 
 All tables use UUID primary keys and include created_at/updated_at timestamps.
+Secondary indexes are built separately in c4e1f8a2b9d3, at the end of the
+revision chain, with CREATE INDEX CONCURRENTLY so they do not hold
+write-blocking locks inside this transaction.
 """
 from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 # revision identifiers, used by Alembic.
 revision: str = 'a3a97102969e'
@@ -34,17 +37,28 @@ def upgrade() -> None:
     op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
     op.execute('CREATE EXTENSION IF NOT EXISTS "pgcrypto";')
     
-    # Get connection to check if tables exist
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    existing_tables = inspector.get_table_names()
+    # Tables only; secondary indexes are built afterwards in c4e1f8a2b9d3
+    _create_tables(op.get_bind())
+
+
+def _create_tables(bind) -> None:
+    """Create every table that does not exist yet, without secondary indexes."""
+    # Check which tables already exist (one catalog query, O(1) lookups)
+    existing_tables = frozenset(
+        bind.exec_driver_sql(
+            "SELECT tablename FROM pg_tables WHERE schemaname = 'public'"
+        ).scalars().all()
+    )
+    
+    # Every table is defined on a local MetaData so foreign keys resolve,
+    # but only the ones that do not exist yet are created.
+    metadata = sa.MetaData()
     
     # ============================================
     # 1. USERS TABLE
     # ============================================
-    if 'users' not in existing_tables:
-        op.create_table(
-            'users',
+    sa.Table(
+        'users', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('full_name', sa.String(length=255), nullable=False),
         sa.Column('email', sa.String(length=255), nullable=False),
@@ -52,18 +66,15 @@ def upgrade() -> None:
         sa.Column('password_hash', sa.String(length=255), nullable=False),
         sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.UniqueConstraint('email', name='users_email_key')
-        )
-        op.create_index('ix_users_id', 'users', ['id'], unique=False)
-        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('email', name='users_email_key')
+    )
     
     # ============================================
     # 2. ACCOUNTS TABLE
     # ============================================
-    if 'accounts' not in existing_tables:
-        op.create_table(
-        'accounts',
+    sa.Table(
+        'accounts', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_name', sa.String(length=255), nullable=False),
         sa.Column('email', sa.String(length=255), nullable=True),
@@ -73,33 +84,29 @@ def upgrade() -> None:
         sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='accounts_created_by_fkey')
-        )
-        op.create_index('ix_accounts_id', 'accounts', ['id'], unique=False)
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='accounts_created_by_fkey')
+    )
     
     # ============================================
     # 3. ROLES TABLE
     # ============================================
-    if 'roles' not in existing_tables:
-        op.create_table(
-        'roles',
+    sa.Table(
+        'roles', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('name', sa.String(length=50), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('description', sa.String(length=255), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.UniqueConstraint('name', name='roles_name_key'),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='roles_account_id_fkey')
-        )
-        op.create_index('ix_roles_id', 'roles', ['id'], unique=False)
+        sa.UniqueConstraint('name', name='roles_name_key'),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='roles_account_id_fkey')
+    )
     
     # ============================================
     # 4. ACCOUNT_USERS TABLE (Join Table)
     # ============================================
-    if 'account_users' not in existing_tables:
-        op.create_table(
-        'account_users',
+    sa.Table(
+        'account_users', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -107,19 +114,17 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='account_users_account_id_fkey'),
-            sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='account_users_user_id_fkey'),
-            sa.ForeignKeyConstraint(['role_id'], ['roles.id'], name='account_users_role_id_fkey')
-        )
-        op.create_index('ix_account_users_id', 'account_users', ['id'], unique=False)
-        # Consider adding unique constraint: (account_id, user_id) where deleted_at IS NULL
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='account_users_account_id_fkey'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='account_users_user_id_fkey'),
+        sa.ForeignKeyConstraint(['role_id'], ['roles.id'], name='account_users_role_id_fkey')
+    )
+    # Consider adding unique constraint: (account_id, user_id) where deleted_at IS NULL
     
     # ============================================
     # 5. MISSIONS TABLE
     # ============================================
-    if 'missions' not in existing_tables:
-        op.create_table(
-        'missions',
+    sa.Table(
+        'missions', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
@@ -131,22 +136,20 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='missions_account_id_fkey'),
-            sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='missions_created_by_fkey')
-        )
-        op.create_index('ix_missions_id', 'missions', ['id'], unique=False)
-        # Consider adding check constraint: end_date >= start_date
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='missions_account_id_fkey'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='missions_created_by_fkey'),
+        sa.CheckConstraint('end_date IS NULL OR start_date IS NULL OR end_date >= start_date', name='missions_date_range')
+    )
     
     # ============================================
     # 6. MISSION_USERS TABLE (Join Table)
     # ============================================
-    # Create enum type for mission roles
-    mission_role_enum = postgresql.ENUM('leader', 'member', 'guest', name='missionrole')
-    mission_role_enum.create(op.get_bind(), checkfirst=True)
+    # Enum type for mission roles. create_type=False keeps table DDL events
+    # from creating it again; it is created once, explicitly, below.
+    mission_role_enum = postgresql.ENUM('leader', 'member', 'guest', name='missionrole', create_type=False)
     
-    if 'mission_users' not in existing_tables:
-        op.create_table(
-        'mission_users',
+    sa.Table(
+        'mission_users', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('mission_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -154,18 +157,16 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='mission_users_mission_id_fkey'),
-            sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='mission_users_user_id_fkey')
-        )
-        op.create_index('ix_mission_users_id', 'mission_users', ['id'], unique=False)
-        # Consider adding unique constraint: (mission_id, user_id) where deleted_at IS NULL
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='mission_users_mission_id_fkey'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='mission_users_user_id_fkey')
+    )
+    # Consider adding unique constraint: (mission_id, user_id) where deleted_at IS NULL
     
     # ============================================
     # 7. OUTREACH_DATA TABLE
     # ============================================
-    if 'outreach_data' not in existing_tables:
-        op.create_table(
-        'outreach_data',
+    sa.Table(
+        'outreach_data', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('mission_id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -176,21 +177,17 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='outreach_data_account_id_fkey'),
-            sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='outreach_data_mission_id_fkey'),
-            sa.ForeignKeyConstraint(['created_by_user_id'], ['users.id'], name='outreach_data_created_by_user_id_fkey')
-        )
-        op.create_index('ix_outreach_data_id', 'outreach_data', ['id'], unique=False)
-        op.create_index('ix_outreach_data_account_id', 'outreach_data', ['account_id'], unique=False)
-        op.create_index('ix_outreach_data_mission_id', 'outreach_data', ['mission_id'], unique=False)
-        # Consider adding index on status and created_by_user_id
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='outreach_data_account_id_fkey'),
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='outreach_data_mission_id_fkey'),
+        sa.ForeignKeyConstraint(['created_by_user_id'], ['users.id'], name='outreach_data_created_by_user_id_fkey')
+    )
+    # Consider adding index on status and created_by_user_id
     
     # ============================================
     # 8. OUTREACH_NUMBERS TABLE
     # ============================================
-    if 'outreach_numbers' not in existing_tables:
-        op.create_table(
-        'outreach_numbers',
+    sa.Table(
+        'outreach_numbers', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('mission_id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -200,20 +197,16 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='outreach_numbers_account_id_fkey'),
-            sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='outreach_numbers_mission_id_fkey'),
-            sa.UniqueConstraint('mission_id', name='outreach_numbers_mission_id_key')
-        )
-        op.create_index('ix_outreach_numbers_id', 'outreach_numbers', ['id'], unique=False)
-        op.create_index('ix_outreach_numbers_account_id', 'outreach_numbers', ['account_id'], unique=False)
-        op.create_index('ix_outreach_numbers_mission_id', 'outreach_numbers', ['mission_id'], unique=True)
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='outreach_numbers_account_id_fkey'),
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='outreach_numbers_mission_id_fkey'),
+        sa.UniqueConstraint('mission_id', name='outreach_numbers_mission_id_key')
+    )
     
     # ============================================
     # 9. EXPENSES TABLE
     # ============================================
-    if 'expenses' not in existing_tables:
-        op.create_table(
-        'expenses',
+    sa.Table(
+        'expenses', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('mission_id', postgresql.UUID(as_uuid=True), nullable=True),
@@ -224,14 +217,29 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='expenses_account_id_fkey'),
-            sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='expenses_mission_id_fkey'),
-            sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='expenses_user_id_fkey')
-        )
-        op.create_index('ix_expenses_id', 'expenses', ['id'], unique=False)
-        op.create_index('ix_expenses_mission_id', 'expenses', ['mission_id'], unique=False)
-        # Consider adding index on category
-        # Consider adding check constraint: amount > 0
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], name='expenses_account_id_fkey'),
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], name='expenses_mission_id_fkey'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='expenses_user_id_fkey'),
+        sa.CheckConstraint('amount > 0', name='expenses_amount_positive')
+    )
+    # Consider adding index on category
+    
+    # ============================================
+    # Create missing tables in one round trip
+    # ============================================
+    # The enum type must exist before the CREATE TABLE that references it,
+    # so it is created on its own first.
+    mission_role_enum.create(bind, checkfirst=True)
+    
+    missing_tables = [
+        table for table in metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+    if missing_tables:
+        op.execute(";\n".join(
+            str(CreateTable(table).compile(dialect=bind.dialect)).strip()
+            for table in missing_tables
+        ))
 
 
 def downgrade() -> None:
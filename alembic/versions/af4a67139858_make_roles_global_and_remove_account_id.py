@@ -20,12 +20,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_constraint(op.f('unique_role_per_account'), 'roles', type_='unique')
-    op.create_unique_constraint(None, 'roles', ['name'])
-    op.drop_constraint(op.f('roles_account_id_fkey'), 'roles', type_='foreignkey')
-    op.drop_column('roles', 'account_id')
-    # ### end Alembic commands ###
+    # All roles changes applied in one ALTER TABLE statement
+    op.execute(
+        "ALTER TABLE roles "
+        "DROP CONSTRAINT unique_role_per_account, "
+        "ADD UNIQUE (name), "
+        "DROP CONSTRAINT roles_account_id_fkey, "
+        "DROP COLUMN account_id"
+    )
 
 
 def downgrade() -> None:
@@ -0,0 +1,70 @@
+"""add_keyset_list_indexes
+
+Revision ID: b6d8f0a2c4e7
+Revises: f3d5e7a9b1c2
+Create Date: 2026-10-15 12:00:00.000000
+
+List endpoints now page with a (created_at, id) keyset and order by
+created_at DESC, id DESC. The partial list indexes from e8b4c6d1a3f7 stop
+at created_at, so ties still need a sort and the row comparison cannot use
+the index fully. These replacements add id as the last key column, and a
+new one covers the expenses-by-user listing.
+
+account_users (user_id, account_id) is already covered by the unique
+partial index ix_account_users_active.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d8f0a2c4e7'
+down_revision: Union[str, Sequence[str], None] = 'f3d5e7a9b1c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+KEYSET_INDEXES = [
+    ('ix_outreach_data_mission_keyset', 'outreach_data', 'mission_id, created_at, id'),
+    ('ix_expenses_mission_keyset', 'expenses', 'mission_id, created_at, id'),
+    ('ix_expenses_user_keyset', 'expenses', 'user_id, created_at, id'),
+    ('ix_missions_account_keyset', 'missions', 'account_id, created_at, id'),
+]
+
+# Superseded by KEYSET_INDEXES (index name, table, columns)
+REPLACED_INDEXES = [
+    ('ix_outreach_data_mission_active', 'outreach_data', 'mission_id, created_at'),
+    ('ix_expenses_mission_active', 'expenses', 'mission_id, created_at'),
+    ('ix_missions_account_active', 'missions', 'account_id, created_at'),
+]
+
+
+def _create(indexes) -> None:
+    for name, table, columns in indexes:
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} ({columns}) WHERE deleted_at IS NULL"
+        )
+
+
+def _drop(indexes) -> None:
+    for name, _table, _columns in indexes:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema - Replace list indexes with keyset-ordered ones."""
+    with op.get_context().autocommit_block():
+        # Build the new indexes before dropping the old ones so list
+        # queries always have an index to use
+        _create(KEYSET_INDEXES)
+        _drop(REPLACED_INDEXES)
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the created_at-only list indexes."""
+    with op.get_context().autocommit_block():
+        _create(REPLACED_INDEXES)
+        _drop(reversed(KEYSET_INDEXES))
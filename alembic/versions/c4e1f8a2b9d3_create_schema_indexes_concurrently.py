@@ -0,0 +1,108 @@
+"""create_schema_indexes_concurrently
+
+Revision ID: c4e1f8a2b9d3
+Revises: a1c3e5f7b9d2
+Create Date: 2026-10-16 00:30:00.000000
+
+Builds the secondary indexes for the tables created in a3a97102969e, which
+no longer creates them itself.
+
+This is a new head rather than a step right after a3a97102969e: databases
+already past that revision created the indexes there and must not have
+released history rewritten under them. For them every build is a no-op.
+Only indexes that still exist at this point in the chain are built; the
+ix_<table>_id indexes were dropped in d9f1b3c5e7a2 and ix_users_email was
+replaced in f3d5e7a9b1c2 / f4b6d8e0a2c3.
+
+CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the
+statements are issued from Alembic's autocommit block. IF NOT EXISTS keeps
+the migration idempotent on databases that already have the indexes.
+
+Set ALEMBIC_PARALLEL_INDEXES=N to build the indexes over N separate
+connections at once; the default builds them one after another.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1f8a2b9d3'
+down_revision: Union[str, Sequence[str], None] = 'a1c3e5f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, unique)
+SCHEMA_INDEXES = [
+    ('ix_outreach_data_account_id', 'outreach_data', 'account_id', False),
+    ('ix_outreach_data_mission_id', 'outreach_data', 'mission_id', False),
+    ('ix_outreach_numbers_account_id', 'outreach_numbers', 'account_id', False),
+    ('ix_outreach_numbers_mission_id', 'outreach_numbers', 'mission_id', True),
+    ('ix_expenses_mission_id', 'expenses', 'mission_id', False),
+]
+
+
+def _parallel_workers() -> int:
+    """Number of connections to build indexes on (1 = sequential)."""
+    try:
+        workers = int(os.getenv('ALEMBIC_PARALLEL_INDEXES', '1'))
+    except ValueError:
+        workers = 1
+    return max(workers, 1)
+
+
+def _run_in_parallel(statements: list[str], workers: int) -> None:
+    """
+    Run each statement on its own autocommit connection.
+
+    Index builds on different tables do not contend with each other, so
+    spreading them over several backends lets Postgres use more cores.
+    """
+    engine = op.get_bind().engine
+
+    def run(statement: str) -> None:
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql(statement)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() re-raises the first failure
+        list(executor.map(run, statements))
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create secondary indexes without blocking writes."""
+    _create_indexes(_parallel_workers())
+
+
+def _create_indexes(workers: int) -> None:
+    """
+    Build SCHEMA_INDEXES once all tables exist.
+
+    Runs after the table-creation revision has committed, so the tables
+    are visible to the extra connections used for parallel builds.
+    """
+    statements = [
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+        f"{name} ON {table} ({columns})"
+        for name, table, columns, unique in SCHEMA_INDEXES
+    ]
+
+    with op.get_context().autocommit_block():
+        if workers > 1 and not context.is_offline_mode():
+            _run_in_parallel(statements, workers)
+        else:
+            for statement in statements:
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema - Keep the indexes.
+
+    Databases migrated before this revision existed got the same indexes
+    from the original a3a97102969e, so dropping them here would leave
+    those databases below their state at a1c3e5f7b9d2.
+    """
+    pass
@@ -0,0 +1,39 @@
+"""add_account_users_by_account_index
+
+Revision ID: c7e9a1b3d5f8
+Revises: b6d8f0a2c4e7
+Create Date: 2026-10-15 18:00:00.000000
+
+The membership check (user_id, account_id) is served by the unique partial
+index ix_account_users_active, but listing the members of an account
+filters on account_id alone, which that index cannot lead with. Add the
+reverse-ordered partial index for it.
+
+mission_users (mission_id, user_id) is already covered by
+ix_mission_users_active, and nothing looks mission_users up by user_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e9a1b3d5f8'
+down_revision: Union[str, Sequence[str], None] = 'b6d8f0a2c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index active account memberships by account."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_account_users_account_active "
+            "ON account_users (account_id, user_id) WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the by-account membership index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_account_users_account_active")
@@ -0,0 +1,80 @@
+"""add_active_membership_unique_indexes
+
+Revision ID: d2a7b3c9e5f1
+Revises: af4a67139858
+Create Date: 2026-10-15 10:00:00.000000
+
+Adds partial unique indexes so a user can hold only one active (not soft
+deleted) membership per account and per mission. They also serve the
+membership lookups done on every account-scoped request.
+
+account_users is keyed (user_id, account_id) so the same index answers
+both "accounts for this user" and "is this user in this account".
+
+The upgrade aborts before building anything if active duplicates exist, and
+an INVALID index left by an interrupted CREATE INDEX CONCURRENTLY is dropped
+and rebuilt.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7b3c9e5f1'
+down_revision: Union[str, Sequence[str], None] = 'af4a67139858'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, key columns)
+INDEXES = (
+    ("ix_account_users_active", "account_users", "user_id, account_id"),
+    ("ix_mission_users_active", "mission_users", "mission_id, user_id"),
+)
+
+
+def _index_valid(bind, name: str):
+    """pg_index.indisvalid of an index, or None if it does not exist."""
+    return bind.exec_driver_sql(
+        f"SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass('{name}')"
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add active membership unique indexes."""
+    bind = op.get_bind()
+    
+    conflicts = []
+    for _, table, columns in INDEXES:
+        rows = bind.exec_driver_sql(
+            f"SELECT {columns} FROM {table} WHERE deleted_at IS NULL "
+            f"GROUP BY {columns} HAVING count(*) > 1 ORDER BY {columns} LIMIT 10"
+        ).all()
+        conflicts.extend(
+            f"{table} ({columns}) = ({', '.join(str(v) for v in row)})" for row in rows
+        )
+    if conflicts:
+        raise RuntimeError(
+            "Cannot add active membership unique indexes: these memberships "
+            "have more than one active row: "
+            + "; ".join(conflicts)
+            + ". Soft delete the extra rows, then re-run the upgrade."
+        )
+    
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            # IF NOT EXISTS would skip an INVALID leftover from a failed build
+            if _index_valid(bind, name) is False:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns}) WHERE deleted_at IS NULL"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop active membership unique indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mission_users_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_account_users_active")
@@ -0,0 +1,48 @@
+"""drop_redundant_primary_key_indexes
+
+Revision ID: d9f1b3c5e7a2
+Revises: c7e9a1b3d5f8
+Create Date: 2026-10-15 20:00:00.000000
+
+BaseModel.id used to be declared with index=True on top of primary_key=True,
+so every table carried an ix_<table>_id index duplicating its primary key
+index. Dropping them removes one index write per insert on every table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f1b3c5e7a2'
+down_revision: Union[str, Sequence[str], None] = 'c7e9a1b3d5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table) - each duplicates the table's primary key on id
+REDUNDANT_ID_INDEXES = [
+    ('ix_users_id', 'users'),
+    ('ix_accounts_id', 'accounts'),
+    ('ix_roles_id', 'roles'),
+    ('ix_account_users_id', 'account_users'),
+    ('ix_missions_id', 'missions'),
+    ('ix_mission_users_id', 'mission_users'),
+    ('ix_outreach_data_id', 'outreach_data'),
+    ('ix_outreach_numbers_id', 'outreach_numbers'),
+    ('ix_expenses_id', 'expenses'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Drop id indexes that duplicate the primary keys."""
+    with op.get_context().autocommit_block():
+        for name, _table in REDUNDANT_ID_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Recreate the id indexes."""
+    with op.get_context().autocommit_block():
+        for name, table in REDUNDANT_ID_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (id)")
@@ -0,0 +1,53 @@
+"""add_account_and_creator_list_indexes
+
+Revision ID: e2a4c6e8f0b1
+Revises: d9f1b3c5e7a2
+Create Date: 2026-10-15 21:00:00.000000
+
+The by-mission, by-user and by-account-for-missions listings have partial
+keyset indexes (b6d8f0a2c4e7), but the remaining soft-delete-aware
+listings still filter on a plain foreign key index and sort:
+
+- outreach data / outreach numbers / expenses by account
+- missions by creator
+
+Add partial (fk, created_at) indexes for them so each is a single ordered
+range scan over active rows. The account-wide dashboard aggregates filter
+the same way and benefit too.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6e8f0b1'
+down_revision: Union[str, Sequence[str], None] = 'd9f1b3c5e7a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+LIST_INDEXES = [
+    ('ix_outreach_data_account_active', 'outreach_data', 'account_id, created_at'),
+    ('ix_outreach_numbers_account_active', 'outreach_numbers', 'account_id, created_at'),
+    ('ix_expenses_account_active', 'expenses', 'account_id, created_at'),
+    ('ix_missions_creator_active', 'missions', 'created_by, created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add partial list indexes for account and creator lookups."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in LIST_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns}) WHERE deleted_at IS NULL"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the account and creator list indexes."""
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(LIST_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
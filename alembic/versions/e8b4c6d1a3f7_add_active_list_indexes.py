@@ -0,0 +1,45 @@
+"""add_active_list_indexes
+
+Revision ID: e8b4c6d1a3f7
+Revises: d2a7b3c9e5f1
+Create Date: 2026-10-15 10:30:00.000000
+
+Adds partial indexes matching the list queries, which filter on a parent
+id with deleted_at IS NULL and order by created_at. Postgres can walk the
+index in order and stop at the page limit instead of filtering and sorting.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4c6d1a3f7'
+down_revision: Union[str, Sequence[str], None] = 'd2a7b3c9e5f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+ACTIVE_INDEXES = [
+    ('ix_outreach_data_mission_active', 'outreach_data', 'mission_id, created_at'),
+    ('ix_expenses_mission_active', 'expenses', 'mission_id, created_at'),
+    ('ix_missions_account_active', 'missions', 'account_id, created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add partial indexes for active-row list queries."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in ACTIVE_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns}) WHERE deleted_at IS NULL"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop active-row list indexes."""
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(ACTIVE_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,40 @@
+"""index_users_email_c_collation
+
+Revision ID: f3d5e7a9b1c2
+Revises: e8b4c6d1a3f7
+Create Date: 2026-10-15 11:00:00.000000
+
+Replaces ix_users_email with an index on email COLLATE "C" so login
+lookups compare bytes instead of going through the database collation.
+Uniqueness is still enforced by the users_email_key constraint.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3d5e7a9b1c2'
+down_revision: Union[str, Sequence[str], None] = 'e8b4c6d1a3f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index users.email with the C collation."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_c '
+            'ON users (email COLLATE "C")'
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the default-collation email index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email "
+            "ON users (email)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_c")
@@ -0,0 +1,78 @@
+"""index_users_email_case_insensitive
+
+Revision ID: f4b6d8e0a2c3
+Revises: e2a4c6e8f0b1
+Create Date: 2026-10-15 23:30:00.000000
+
+Replaces ix_users_email_c with a unique index on lower(email) COLLATE "C"
+so logins and registration checks match emails case-insensitively while
+staying index scans. The unique index makes emails differing only by case
+collide, so the upgrade aborts before building anything if such duplicates
+exist.
+
+The build is safe to re-run: an INVALID ix_users_email_lower left by an
+interrupted CREATE INDEX CONCURRENTLY is dropped first, and ix_users_email_c
+is only dropped once the new index is valid.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b6d8e0a2c3'
+down_revision: Union[str, Sequence[str], None] = 'e2a4c6e8f0b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_valid(bind, name: str):
+    """pg_index.indisvalid of an index, or None if it does not exist."""
+    return bind.exec_driver_sql(
+        f"SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass('{name}')"
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index users.email case-insensitively."""
+    bind = op.get_bind()
+    
+    duplicates = bind.exec_driver_sql(
+        "SELECT lower(email) FROM users GROUP BY lower(email) "
+        "HAVING count(*) > 1 ORDER BY 1 LIMIT 10"
+    ).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Cannot index users.email case-insensitively: these emails are "
+            "used by more than one user (ignoring case): "
+            + ", ".join(duplicates)
+            + ". Merge or rename those users, then re-run the upgrade."
+        )
+    
+    with op.get_context().autocommit_block():
+        # IF NOT EXISTS would skip an INVALID leftover from a failed build
+        if _index_valid(bind, "ix_users_email_lower") is False:
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
+        
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower '
+            'ON users ((lower(email) COLLATE "C"))'
+        )
+        
+        # Keep the old index until logins have a usable replacement
+        if not _index_valid(bind, "ix_users_email_lower"):
+            raise RuntimeError(
+                "ix_users_email_lower was not built as a valid index; "
+                "ix_users_email_c was kept. Re-run the upgrade."
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_c")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the C-collation email index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_c '
+            'ON users (email COLLATE "C")'
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
@@ -17,14 +17,19 @@ depends_on = None
 
 
 def upgrade():
-    # Drop the old unique constraint on name only
-    op.drop_constraint('roles_name_key', 'roles', type_='unique')
-    
-    # Add composite unique constraint on (name, account_id)
-    op.create_unique_constraint('unique_role_per_account', 'roles', ['name', 'account_id'])
+    # Swap the unique constraint on name only for a composite one on
+    # (name, account_id) in a single ALTER TABLE (one catalog lock/round trip)
+    op.execute(
+        "ALTER TABLE roles "
+        "DROP CONSTRAINT roles_name_key, "
+        "ADD CONSTRAINT unique_role_per_account UNIQUE (name, account_id)"
+    )
 
 
 def downgrade():
     # Revert to old constraint
-    op.drop_constraint('unique_role_per_account', 'roles', type_='unique')
-    op.create_unique_constraint('roles_name_key', 'roles', ['name'])
+    op.execute(
+        "ALTER TABLE roles "
+        "DROP CONSTRAINT unique_role_per_account, "
+        "ADD CONSTRAINT roles_name_key UNIQUE (name)"
+    )
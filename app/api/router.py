@@ -4,9 +4,10 @@ Main API Router
 This module aggregates all API version routers.
 """
 
-from fastapi import APIRouter
+import json
+
+from fastapi import APIRouter, Response
 
-# Import version routers
 # Import version routers
 from app.api.v1 import auth, missions, expenses, outreach, users, accounts, dashboard
 
@@ -22,19 +23,22 @@ api_router.include_router(outreach.router, prefix="/v1/outreach", tags=["Outreac
 api_router.include_router(users.router, prefix="/v1/users", tags=["Users"])
 api_router.include_router(dashboard.router, prefix="/v1/dashboard", tags=["Dashboard"])
 
+# API info body is static, so it is encoded once at import time
+_API_INFO_BODY = json.dumps({
+    "version": "v1",
+    "status": "active",
+    "endpoints": {
+        "auth": "/api/v1/auth",
+        "missions": "/api/v1/missions",
+        "expenses": "/api/v1/expenses",
+        "outreach": "/api/v1/outreach",
+        "users": "/api/v1/users"
+    }
+}).encode("utf-8")
+
+
 # API info endpoint
 @api_router.get("/v1")
 async def api_info():
     """API version information."""
-    return {
-        "version": "v1",
-        "status": "active",
-        "endpoints": {
-            "auth": "/api/v1/auth",
-            "missions": "/api/v1/missions",
-            "expenses": "/api/v1/expenses",
-            "outreach": "/api/v1/outreach",
-            "users": "/api/v1/users"
-        }
-    }
-
+    return Response(content=_API_INFO_BODY, media_type="application/json")
@@ -9,15 +9,31 @@ This module handles authentication endpoints:
 - POST /api/v1/auth/logout
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+import time
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
+from app.core.cache import revoke_token
+from app.core.dependencies import (
+    security,
+    forget_cached_token,
+    get_database_session,
+    get_current_active_user,
+    get_auth_service,
+    verify_account_access
+)
+from app.core.security import create_token_pair, decode_token, token_fingerprint
 from app.models.user import User
 from app.schemas.auth import (
     UserRegister,
     UserLogin,
     TokenRefresh,
+    LogoutRequest,
     AuthResponse,
     UserResponse,
     TokenResponse,
@@ -27,18 +43,20 @@ from app.services.auth import AuthService
 
 router = APIRouter()
 
+# Logout always returns the same body, so it is encoded once at import time
+_LOGOUT_BODY = json.dumps({"message": "Successfully logged out"}).encode("utf-8")
+
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserRegister,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Register a new user account.
     
     Creates a new user account and returns authentication tokens.
     """
-    auth_service = AuthService(db)
     user, tokens = await auth_service.register(user_data)
     
     return AuthResponse(
@@ -52,14 +70,13 @@ async def register(
 @router.post("/login", response_model=AuthResponse)
 async def login(
     login_data: UserLogin,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Authenticate user and return access tokens.
     
     Validates user credentials and returns JWT tokens for authenticated requests.
     """
-    auth_service = AuthService(db)
     user, tokens, available_accounts = await auth_service.login(login_data)
     
     return AuthResponse(
@@ -86,14 +103,13 @@ async def get_current_user_info(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     token_data: TokenRefresh,
-    db: AsyncSession = Depends(get_database_session)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Refresh access token using refresh token.
     
     Generates a new access token from a valid refresh token.
     """
-    auth_service = AuthService(db)
     tokens = await auth_service.refresh_token(token_data.refresh_token)
     
     return TokenResponse(
@@ -105,21 +121,42 @@ async def refresh_token(
 
 @router.post("/logout", response_model=MessageResponse)
 async def logout(
+    logout_data: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Logout user (client-side token invalidation).
+    Logout user.
     
-    Note: Since we're using stateless JWT tokens, actual invalidation
-    should be handled client-side. This endpoint is provided for
-    consistency with the API contract.
+    Adds the access token, and the refresh token if one is sent in the
+    body, to the revoked list until they expire. Revoked access tokens are
+    rejected by get_current_user and revoked refresh tokens by /refresh.
+    The list is shared by every worker only when REDIS_URL is set; without
+    it, each worker process keeps its own list and the tokens stay valid on
+    the others. Returns 503 if the list cannot be written.
     """
-    return MessageResponse(message="Successfully logged out")
+    revoked = [credentials.credentials]
+    
+    if logout_data and logout_data.refresh_token:
+        payload = decode_token(logout_data.refresh_token)
+        if payload.get("type") != "refresh" or payload.get("user_id") != str(current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid refresh token"
+            )
+        revoked.append(logout_data.refresh_token)
+    
+    for token in revoked:
+        fingerprint = token_fingerprint(token)
+        expires_at = jwt.get_unverified_claims(token).get("exp", 0)
+        await revoke_token(fingerprint, int(expires_at - time.time()))
+        forget_cached_token(fingerprint)
+    return Response(content=_LOGOUT_BODY, media_type="application/json")
 
 
 @router.post("/switch-account/{account_id}", response_model=TokenResponse)
 async def switch_account(
-    account_id: str,
+    account_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_database_session)
 ):
@@ -129,9 +166,6 @@ async def switch_account(
     This allows users who belong to multiple accounts to switch between them.
     The new token will have the specified account_id in its payload.
     """
-    from app.core.dependencies import verify_account_access
-    from app.core.security import create_token_pair
-    
     # Verify user has access to account
     account = await verify_account_access(account_id, current_user, db)
     
@@ -139,7 +173,7 @@ async def switch_account(
     tokens = create_token_pair(
         user_id=str(current_user.id),
         email=current_user.email,
-        account_id=account_id
+        account_id=str(account_id)
     )
     
     return TokenResponse(
@@ -5,12 +5,22 @@ This module handles dashboard endpoints:
 - GET /api/v1/dashboard/stats
 - GET /api/v1/dashboard/map
 - GET /api/v1/dashboard/summary
+- POST /api/v1/dashboard/invalidate
+
+Responses are cached per account and user (see app.core.cache).
 """
 
-from fastapi import APIRouter, Depends, Query
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, status
+from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
+from app.core.cache import account_user_key_builder, invalidate_dashboard_cache
+from app.core.dependencies import (
+    get_database_session,
+    get_current_active_user,
+    verify_account_access
+)
 from app.models.user import User
 from app.schemas.dashboard import (
     DashboardStats,
@@ -19,12 +29,13 @@ from app.schemas.dashboard import (
 )
 from app.services.dashboard import DashboardService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
 
 
 @router.get("/stats", response_model=DashboardStats)
+@cache(key_builder=account_user_key_builder)
 async def get_dashboard_stats(
-    account_id: str = Query(..., description="Account ID to get stats for"),
+    account_id: UUID = Query(..., description="Account ID to get stats for"),
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -34,8 +45,9 @@ async def get_dashboard_stats(
 
 
 @router.get("/map", response_model=DashboardMapResponse)
+@cache(key_builder=account_user_key_builder)
 async def get_map_data(
-    account_id: str = Query(..., description="Account ID to get map data for"),
+    account_id: UUID = Query(..., description="Account ID to get map data for"),
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -45,11 +57,24 @@ async def get_map_data(
 
 
 @router.get("/summary", response_model=DashboardSummaryResponse)
+@cache(key_builder=account_user_key_builder)
 async def get_dashboard_summary(
-    account_id: str = Query(..., description="Account ID to get summary for"),
+    account_id: UUID = Query(..., description="Account ID to get summary for"),
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get combined dashboard summary with stats and map data."""
     service = DashboardService(db)
     return await service.get_dashboard_summary(account_id)
+
+
+@router.post("/invalidate", status_code=status.HTTP_204_NO_CONTENT)
+async def invalidate_dashboard(
+    account_id: UUID = Query(..., description="Account ID to invalidate cached dashboard data for"),
+    db: AsyncSession = Depends(get_database_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Drop cached dashboard responses for an account the user belongs to."""
+    await verify_account_access(account_id, current_user, db)
+    await invalidate_dashboard_cache(account_id)
+    return None
@@ -9,35 +9,56 @@ This module handles expense endpoints:
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from uuid import UUID
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
+from app.core.dependencies import (
+    get_database_session,
+    get_current_active_user,
+    get_page_cursor
+)
+from app.repositories.base import Cursor
 from app.models.user import User
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse
 from app.services.expense import ExpenseService
+from app.utils.helpers import next_page_headers
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
+
+_expense_list_adapter = TypeAdapter(List[ExpenseResponse])
 
 
 @router.get("", response_model=List[ExpenseResponse])
 async def list_expenses(
-    mission_id: Optional[str] = Query(None, description="Mission ID to filter expenses"),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    mission_id: Optional[UUID] = Query(None, description="Mission ID to filter expenses"),
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(100, ge=1, le=100),
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    """List expenses, optionally filtered by mission."""
+    """
+    List expenses, optionally filtered by mission, newest first.
+    
+    Pages are keyset-paginated: follow the rel="next" Link header, which
+    carries an `after` cursor. `skip` is kept for older clients only.
+    """
     service = ExpenseService(db)
     
     if mission_id:
-        expenses = await service.get_expenses_by_mission(mission_id, skip, limit)
+        expenses = await service.get_expenses_by_mission(mission_id, skip, limit, after=after)
     else:
         # Get user's expenses if no mission_id provided
-        expenses = await service.expense_repo.get_by_user(str(current_user.id), skip, limit)
+        expenses = await service.expense_repo.get_by_user(current_user.id, skip, limit, after=after)
     
-    return [ExpenseResponse.from_expense(expense) for expense in expenses]
+    return Response(
+        content=_expense_list_adapter.dump_json([ExpenseResponse.from_expense(row) for row in expenses]),
+        media_type="application/json",
+        headers=next_page_headers(request, expenses, limit)
+    )
 
 
 @router.post("", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
@@ -48,13 +69,13 @@ async def create_expense(
 ):
     """Create a new expense."""
     service = ExpenseService(db)
-    expense = await service.create_expense(expense_data, current_user)
+    expense = await service.create_expense(expense_data, current_user.id)
     return ExpenseResponse.from_expense(expense)
 
 
 @router.put("/{expense_id}", response_model=ExpenseResponse)
 async def update_expense(
-    expense_id: str,
+    expense_id: UUID,
     expense_data: ExpenseUpdate,
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
@@ -67,7 +88,7 @@ async def update_expense(
 
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_expense(
-    expense_id: str,
+    expense_id: UUID,
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -9,30 +9,46 @@ This module handles mission endpoints:
 - DELETE /api/v1/missions/{id}
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, Query, status
+from typing import List, Optional
+from uuid import UUID
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
+from app.core.dependencies import get_database_session, get_current_active_user, get_page_cursor
+from app.repositories.base import Cursor
 from app.models.user import User
 from app.schemas.mission import MissionCreate, MissionUpdate, MissionResponse
 from app.services.mission import MissionService
+from app.utils.helpers import next_page_headers
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
+
+_mission_list_adapter = TypeAdapter(List[MissionResponse])
 
 
 @router.get("", response_model=List[MissionResponse])
 async def list_missions(
-    account_id: str = Query(..., description="Account ID to filter missions"),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    account_id: UUID = Query(..., description="Account ID to filter missions"),
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(100, ge=1, le=100),
-    db: AsyncSession = Depends(get_database_session),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_database_session)
 ):
-    """List missions for an account."""
+    """
+    List missions for an account, newest first.
+    
+    Pages are keyset-paginated: follow the rel="next" Link header, which
+    carries an `after` cursor. `skip` is kept for older clients only.
+    """
     service = MissionService(db)
-    missions = await service.get_missions_by_account(account_id, skip, limit)
-    return [MissionResponse.from_mission(mission) for mission in missions]
+    missions = await service.get_missions_by_account(account_id, skip, limit, after=after)
+    return Response(
+        content=_mission_list_adapter.dump_json([MissionResponse.from_mission(row) for row in missions]),
+        media_type="application/json",
+        headers=next_page_headers(request, missions, limit)
+    )
 
 
 @router.post("", response_model=MissionResponse, status_code=status.HTTP_201_CREATED)
@@ -49,9 +65,8 @@ async def create_mission(
 
 @router.get("/{mission_id}", response_model=MissionResponse)
 async def get_mission(
-    mission_id: str,
-    db: AsyncSession = Depends(get_database_session),
-    current_user: User = Depends(get_current_active_user)
+    mission_id: UUID,
+    db: AsyncSession = Depends(get_database_session)
 ):
     """Get mission by ID."""
     service = MissionService(db)
@@ -61,7 +76,7 @@ async def get_mission(
 
 @router.put("/{mission_id}", response_model=MissionResponse)
 async def update_mission(
-    mission_id: str,
+    mission_id: UUID,
     mission_data: MissionUpdate,
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
@@ -74,7 +89,7 @@ async def update_mission(
 
 @router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mission(
-    mission_id: str,
+    mission_id: UUID,
     db: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -9,10 +9,13 @@ This module handles outreach endpoints:
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from uuid import UUID
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
+from app.core.dependencies import get_database_session, get_current_active_user, get_page_cursor
+from app.repositories.base import Cursor
 from app.models.user import User
 from app.schemas.outreach import (
     OutreachDataCreate,
@@ -22,28 +25,39 @@ from app.schemas.outreach import (
     OutreachNumbersResponse
 )
 from app.services.outreach import OutreachService
+from app.utils.helpers import next_page_headers
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
+
+_outreach_data_list_adapter = TypeAdapter(List[OutreachDataResponse])
 
 
 @router.get("/data", response_model=List[OutreachDataResponse])
 async def list_outreach_data(
-    mission_id: Optional[str] = Query(None, description="Mission ID to filter outreach data"),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    mission_id: Optional[UUID] = Query(None, description="Mission ID to filter outreach data"),
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(100, ge=1, le=100),
-    db: AsyncSession = Depends(get_database_session),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_database_session)
 ):
-    """List outreach data, optionally filtered by mission."""
-    service = OutreachService(db)
+    """
+    List outreach data, optionally filtered by mission, newest first.
     
-    if mission_id:
-        data = await service.get_outreach_data_by_mission(mission_id, skip, limit)
-    else:
+    Pages are keyset-paginated: follow the rel="next" Link header, which
+    carries an `after` cursor. `skip` is kept for older clients only.
+    """
+    if not mission_id:
         # Get all for user's missions if no mission_id
-        data = []
+        return []
     
-    return [OutreachDataResponse.from_outreach_data(item) for item in data]
+    service = OutreachService(db)
+    data = await service.get_outreach_data_by_mission(mission_id, skip, limit, after=after)
+    return Response(
+        content=_outreach_data_list_adapter.dump_json([OutreachDataResponse.from_outreach_data(row) for row in data]),
+        media_type="application/json",
+        headers=next_page_headers(request, data, limit)
+    )
 
 
 @router.post("/data", response_model=OutreachDataResponse, status_code=status.HTTP_201_CREATED)
@@ -60,9 +74,8 @@ async def create_outreach_data(
 
 @router.get("/numbers", response_model=Optional[OutreachNumbersResponse])
 async def get_outreach_numbers(
-    mission_id: str = Query(..., description="Mission ID"),
-    db: AsyncSession = Depends(get_database_session),
-    current_user: User = Depends(get_current_active_user)
+    mission_id: UUID = Query(..., description="Mission ID"),
+    db: AsyncSession = Depends(get_database_session)
 ):
     """Get outreach numbers for a mission."""
     service = OutreachService(db)
@@ -77,8 +90,7 @@ async def get_outreach_numbers(
 @router.post("/numbers", response_model=OutreachNumbersResponse)
 async def create_or_update_outreach_numbers(
     numbers_data: OutreachNumbersCreate,
-    db: AsyncSession = Depends(get_database_session),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_database_session)
 ):
     """Create or update outreach numbers for a mission."""
     service = OutreachService(db)
@@ -6,13 +6,12 @@ This module handles user endpoints:
 """
 
 from typing import List
+from uuid import UUID
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_database_session, get_current_active_user
-from app.models.user import User
+from app.core.dependencies import get_database_session, get_current_user_id
 from app.schemas.account import AccountResponse
-from app.repositories.account_user import AccountUserRepository
 from app.repositories.account import AccountRepository
 
 router = APIRouter()
@@ -20,7 +19,7 @@ router = APIRouter()
 
 @router.get("/accounts", response_model=List[AccountResponse])
 async def get_user_accounts(
-    current_user: User = Depends(get_current_active_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_database_session)
 ):
     """
@@ -28,18 +27,9 @@ async def get_user_accounts(
     
     Returns a list of accounts the authenticated user has access to.
     """
-    account_user_repo = AccountUserRepository(db)
     account_repo = AccountRepository(db)
     
-    # Get all account-user relationships for this user
-    account_users = await account_user_repo.get_by_user_id(str(current_user.id))
-    
-    # Get account details
-    accounts = []
-    for au in account_users:
-        account = await account_repo.get_by_id(str(au.account_id))
-        if account and account.is_active:
-            accounts.append(AccountResponse.model_validate(account))
-    
-    return accounts
-
+    # Single JOIN over account_users instead of one lookup per membership.
+    # The ORM rows are returned as-is: the response_model's cached
+    # TypeAdapter validates the whole list (from_attributes) in one call.
+    return await account_repo.get_active_for_user(current_user_id)
@@ -0,0 +1,173 @@
+"""
+Response Caching
+
+This module configures fastapi-cache2 for the dashboard endpoints:
+- Redis backend when REDIS_URL is set, in-memory backend otherwise
+- Cache keys scoped by account and user
+- Per-account invalidation after writes (a version counter in Redis)
+
+The same backend holds the revoked-token list checked by get_current_user
+and token refresh. Revocations are shared between worker processes only
+with Redis; the in-memory backend is per process. Revocation fails closed:
+if the backend is unreachable, both revoking and checking return 503.
+"""
+
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_PREFIX = "dash"
+DASHBOARD_VERSION_PREFIX = "dashver"
+REVOKED_TOKEN_PREFIX = "revoked"
+
+# Redis client behind the cache backend; None when using the in-memory backend
+_redis: Optional[aioredis.Redis] = None
+
+
+def init_cache() -> None:
+    """Initialize the response cache backend."""
+    global _redis
+    
+    if settings.REDIS_URL:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+        backend = RedisBackend(_redis)
+    else:
+        _redis = None
+        backend = InMemoryBackend()
+        logger.warning(
+            "REDIS_URL is not set: cached responses and revoked tokens are "
+            "kept per worker process"
+        )
+    
+    FastAPICache.init(
+        backend,
+        prefix=DASHBOARD_CACHE_PREFIX,
+        expire=settings.DASHBOARD_CACHE_EXPIRE_SECONDS
+    )
+
+
+async def _account_cache_version(account_id: UUID | str) -> int:
+    """
+    Current dashboard cache version of an account (always 0 in memory).
+    
+    Returns 0 (and logs) if Redis is unavailable.
+    """
+    if _redis is None:
+        return 0
+    try:
+        version = await _redis.get(f"{DASHBOARD_VERSION_PREFIX}:{account_id}")
+    except Exception as e:
+        logger.warning(f"Dashboard cache version lookup failed for account {account_id}: {e}")
+        return 0
+    return int(version or 0)
+
+
+async def account_user_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Build a cache key from the route, account and current user.
+    
+    The user ID is part of the key so one user's cached response is never
+    served to another. The account ID leads the key and is followed by the
+    account's cache version, so invalidate_dashboard_cache() can retire
+    every entry for an account at once.
+    """
+    account_id = kwargs["account_id"]
+    user_id = kwargs["current_user"].id
+    version = await _account_cache_version(account_id)
+    digest = hashlib.sha256(
+        f"{func.__module__}:{func.__name__}:{user_id}".encode()
+    ).hexdigest()
+    return f"{FastAPICache.get_prefix()}:{account_id}:v{version}:{digest}"
+
+
+async def invalidate_dashboard_cache(account_id: UUID | str) -> None:
+    """
+    Drop all cached dashboard responses for an account.
+    
+    With Redis, the account's version counter is bumped (INCR) so new keys
+    no longer match the old entries, which then expire on their own. That
+    avoids FastAPICache.clear(), which runs a keyspace-wide KEYS scan on
+    Redis. The in-memory backend clears the account's entries directly.
+    
+    Failures are logged and swallowed: a stale dashboard must not fail
+    the write that triggered the invalidation.
+    """
+    try:
+        if _redis is not None:
+            await _redis.incr(f"{DASHBOARD_VERSION_PREFIX}:{account_id}")
+        else:
+            await FastAPICache.clear(namespace=str(account_id))
+    except Exception as e:
+        logger.warning(f"Dashboard cache invalidation failed for account {account_id}: {e}")
+
+
+def _revocation_unavailable() -> HTTPException:
+    """503 raised when the revoked-token list cannot be read or written."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Token revocation is temporarily unavailable"
+    )
+
+
+async def revoke_token(fingerprint: str, expires_in: int) -> None:
+    """
+    Add a token fingerprint to the revoked list until the token expires.
+    
+    Without REDIS_URL the list is in-process memory, so the revocation
+    only applies to the worker that handled the logout.
+    
+    Args:
+        fingerprint: Token fingerprint (see token_fingerprint())
+        expires_in: Seconds until the token would expire on its own
+        
+    Raises:
+        HTTPException: 503 if the cache backend is unavailable
+    """
+    if expires_in <= 0:
+        return
+    try:
+        await FastAPICache.get_backend().set(
+            f"{REVOKED_TOKEN_PREFIX}:{fingerprint}", b"1", expires_in
+        )
+    except Exception as e:
+        logger.error(f"Token revocation failed: {e}")
+        raise _revocation_unavailable()
+
+
+async def is_token_revoked(fingerprint: str) -> bool:
+    """
+    Check the revoked list for a token fingerprint.
+    
+    Fails closed, like revoke_token: a revoked token must never be
+    accepted again just because the cache backend is down.
+    
+    Raises:
+        HTTPException: 503 if the cache backend is unavailable
+    """
+    try:
+        revoked = await FastAPICache.get_backend().get(f"{REVOKED_TOKEN_PREFIX}:{fingerprint}")
+    except Exception as e:
+        logger.error(f"Revoked-token lookup failed: {e}")
+        raise _revocation_unavailable()
+    return revoked is not None
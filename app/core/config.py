@@ -1,4 +1,5 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyUrl, EmailStr, Field, field_validator
 import secrets
@@ -10,7 +11,8 @@ class Settings(BaseSettings):
     """
     model_config = SettingsConfigDict(
         env_file=".env",
-        env_file_encoding="utf-8"
+        env_file_encoding="utf-8",
+        frozen=True
     )
 
     # -------------------------
@@ -18,6 +20,12 @@ class Settings(BaseSettings):
     # -------------------------
     DATABASE_URL: AnyUrl
 
+    # -------------------------
+    # Cache
+    # -------------------------
+    REDIS_URL: Optional[str] = None
+    DASHBOARD_CACHE_EXPIRE_SECONDS: int = 300
+
     # -------------------------
     # Security / Auth
     # -------------------------
@@ -25,6 +33,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # bcrypt work factor for new password hashes (each +1 doubles the cost)
+    BCRYPT_ROUNDS: int = 12
+    # In-process cache of authenticated users, keyed by token
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAXSIZE: int = 10_000
+    # Worker threads for blocking work (bcrypt, sync dependencies)
+    THREADPOOL_SIZE: int = 64
 
     # -------------------------
     # Email / SMTP
@@ -42,7 +57,9 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     TIMEZONE: str = "UTC"
 
-    CORS_ORIGINS: List[str] = Field(default_factory=lambda: [
+    # Union with str lets pydantic-settings hand a non-JSON env value
+    # (e.g. "http://a, http://b") to the validator below instead of failing
+    CORS_ORIGINS: Union[List[str], str] = Field(default_factory=lambda: [
         "http://localhost:3000",
         "http://localhost:8080",
         "http://localhost:5000",
@@ -51,11 +68,15 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5000",
     ])
     FRONTEND_URL: Optional[str] = None
-    ALLOWED_HOSTS: List[str] = Field(default_factory=lambda: ["localhost", "127.0.0.1"])
+    ALLOWED_HOSTS: Union[List[str], str] = Field(default_factory=lambda: ["localhost", "127.0.0.1"])
 
     SQLALCHEMY_ECHO: bool = False
     DB_POOL_MIN_SIZE: Optional[int] = None
     DB_POOL_MAX_SIZE: Optional[int] = None
+    # Set when DATABASE_URL points at PgBouncer in transaction mode
+    DB_USE_PGBOUNCER: bool = False
+    # Open the persistent pool connections at startup instead of on first use
+    DB_POOL_PREWARM: bool = True
 
     SENTRY_DSN: Optional[AnyUrl] = None
 
@@ -65,8 +86,8 @@ class Settings(BaseSettings):
     # Validators (Pydantic V2)
     # -------------------------
 
-    @field_validator("CORS_ORIGINS", mode="before")
-    def parse_cors_origins(cls, v):
+    @field_validator("CORS_ORIGINS", "ALLOWED_HOSTS", mode="before")
+    def parse_comma_separated(cls, v):
         """
         Accept list OR comma-separated string:
         "http://a, http://b"
@@ -82,4 +103,14 @@ class Settings(BaseSettings):
         return v
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings, parsing the environment only once.
+    
+    Usable as a FastAPI dependency: settings: Settings = Depends(get_settings)
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,10 +1,20 @@
 import ssl
+import time
+import asyncio
 import logging
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import text
+from cachetools import TLRUCache
+
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    async_scoped_session,
+    async_sessionmaker,
+    AsyncSession,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy import event, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import settings
 
@@ -12,7 +22,12 @@ from .config import settings
 # Logging
 # ----------------------------------------------------
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+# Statement logging goes through the sqlalchemy.engine logger (enabled by
+# SQLALCHEMY_ECHO) rather than the engine's echo flag
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.SQLALCHEMY_ECHO else logging.WARNING
+)
 
 # Base for all ORM models
 Base = declarative_base()
@@ -28,30 +43,81 @@ def build_ssl_context():
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = True
     ssl_context.verify_mode = ssl.CERT_REQUIRED
+    # Accept session tickets and advertise the PostgreSQL ALPN protocol
+    # (required by PostgreSQL 17+ for direct SSL, ignored by older servers)
+    ssl_context.options &= ~ssl.OP_NO_TICKET
+    ssl_context.set_alpn_protocols(["postgresql"])
     return ssl_context
 
 
+# Built once: loading the CA bundle is the expensive part, and every pool
+# connection shares the same context
+SSL_CONTEXT = build_ssl_context()
+
+
 # ----------------------------------------------------
 # Engine Configuration
 # ----------------------------------------------------
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 10
+
+
+def pool_limits() -> tuple[int, int]:
+    """
+    Resolve (pool_size, max_overflow) from DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE.
+
+    DB_POOL_MIN_SIZE is the number of persistent connections and
+    DB_POOL_MAX_SIZE the hard cap including overflow connections.
+    """
+    pool_size = settings.DB_POOL_MIN_SIZE or DEFAULT_POOL_SIZE
+    if settings.DB_POOL_MAX_SIZE:
+        max_overflow = max(settings.DB_POOL_MAX_SIZE - pool_size, 0)
+    else:
+        max_overflow = DEFAULT_MAX_OVERFLOW
+    return pool_size, max_overflow
+
+
 def build_engine():
-    # Cloud PostgreSQL (Neon)
-    ssl_context = build_ssl_context()
+    """
+    Production deployments should point DATABASE_URL at PgBouncer
+    (port 6432) in transaction mode and set DB_USE_PGBOUNCER=true;
+    development can connect to Neon/Postgres directly.
+    """
+    pool_size, max_overflow = pool_limits()
+
+    connect_args = {
+        # Cloud PostgreSQL (Neon)
+        "ssl": SSL_CONTEXT,
+        "server_settings": {
+            "application_name": settings.PROJECT_NAME,
+        }
+    }
+    if settings.DB_USE_PGBOUNCER:
+        # Prepared statements do not survive PgBouncer handing the
+        # server connection to another client between transactions
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+    else:
+        # Short OLTP queries never benefit from JIT compilation. PgBouncer
+        # rejects unknown startup parameters, so set jit there instead.
+        connect_args["server_settings"]["jit"] = "off"
+        # Keep every hot repository statement prepared on each connection
+        # (asyncpg and SQLAlchemy default to 100)
+        connect_args["statement_cache_size"] = 500
+        connect_args["prepared_statement_cache_size"] = 500
 
     engine_kwargs = {
-        "echo": settings.DEBUG,
         "future": True,
-        "pool_size": 10,
-        "max_overflow": 5,
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
         "pool_timeout": 30,
         "pool_pre_ping": True,
-        "pool_recycle": 3600,  # refresh connections every hour
-        "connect_args": {
-            "ssl": ssl_context,
-            "server_settings": {
-                "application_name": settings.PROJECT_NAME,
-            }
-        },
+        "pool_recycle": 7200,  # refresh connections every two hours
+        # Compiled SQL cache (default 500); the app's distinct statements,
+        # times loader-option and parameter-shape variants, exceed that
+        "query_cache_size": 1200,
+        "connect_args": connect_args,
     }
 
     # Remove SSL parameters from URL if included
@@ -66,34 +132,81 @@ def build_engine():
     return create_async_engine(clean_url, **engine_kwargs)
 
 
+# ----------------------------------------------------
+# Slow Query EXPLAIN (development only)
+# ----------------------------------------------------
+SLOW_QUERY_EXPLAIN_MS = 50
+
+
+def install_slow_query_explain(async_engine, threshold_ms: int = SLOW_QUERY_EXPLAIN_MS):
+    """
+    Log EXPLAIN (ANALYZE, BUFFERS) for SELECTs slower than threshold_ms.
+
+    EXPLAIN ANALYZE runs the query a second time, so this is only
+    installed in DEBUG mode. Streamed (server-side cursor) results are
+    skipped because the connection is still busy with them.
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _explain_if_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if elapsed_ms < threshold_ms or executemany:
+            return
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return
+        if context is not None and context.execution_options.get("stream_results"):
+            return
+
+        try:
+            explain_cursor = conn.connection.cursor()
+            explain_cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+            explain_cursor.close()
+            logger.warning(f"Slow query ({elapsed_ms:.1f} ms):\n{statement}\n{plan}")
+        except Exception as e:
+            logger.warning(f"Slow query ({elapsed_ms:.1f} ms), EXPLAIN failed: {e}")
+
+
 # Create global engine
 engine = build_engine()
 
+if settings.DEBUG:
+    install_slow_query_explain(engine)
+
 # ----------------------------------------------------
 # Session Factory
 # ----------------------------------------------------
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
+AsyncSessionLocal = async_sessionmaker(
+    engine,
     expire_on_commit=False,
-    autocommit=False,
     autoflush=False,
 )
 
+# One session per asyncio task (i.e. per request): anything running in the
+# request task that asks for SessionScoped() gets the request's session
+SessionScoped = async_scoped_session(
+    AsyncSessionLocal,
+    scopefunc=asyncio.current_task,
+)
+
 
 # ----------------------------------------------------
 # Dependency for framework routes/services
 # ----------------------------------------------------
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Provides an async database session for each request.
-    Ensures session is closed cleanly after use.
+    Provides the request task's scoped async database session.
+    Ensures session is closed and released from the scope after use.
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    try:
+        yield SessionScoped()
+    finally:
+        await SessionScoped.remove()
 
 
 # ----------------------------------------------------
@@ -135,6 +248,59 @@ async def check_db_connection() -> bool:
         return False
 
 
+# Probe results are shared for a couple of seconds so that bursts of
+# health/readiness probes cost one SELECT 1; failures expire sooner so
+# recovery is reported quickly
+HEALTH_CHECK_CACHE_SECONDS = 2.0
+HEALTH_CHECK_FAILURE_CACHE_SECONDS = 1.0
+
+_health_cache: TLRUCache[str, bool] = TLRUCache(
+    maxsize=1,
+    ttu=lambda _key, healthy, now: now + (
+        HEALTH_CHECK_CACHE_SECONDS if healthy else HEALTH_CHECK_FAILURE_CACHE_SECONDS
+    ),
+)
+
+
+async def check_db_connection_cached() -> bool:
+    """
+    check_db_connection() with its result reused for a few seconds.
+    Intended for frequently polled health/readiness endpoints.
+    """
+    healthy = _health_cache.get("db")
+    if healthy is None:
+        healthy = await check_db_connection()
+        _health_cache["db"] = healthy
+    return healthy
+
+
+async def prewarm_pool() -> int:
+    """
+    Open the pool's persistent connections concurrently and return them
+    to the pool, so the first requests after startup skip the TCP/TLS/auth
+    handshake.
+    
+    Returns:
+        Number of connections opened
+    """
+    pool_size, _ = pool_limits()
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(pool_size)),
+        return_exceptions=True
+    )
+    
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning(f"Connection pool prewarm failed: {result}")
+            continue
+        await result.close()
+        opened += 1
+    
+    logger.info(f"Connection pool prewarmed with {opened} connections.")
+    return opened
+
+
 async def invalidate_connection_pool():
     """
     Clears all cached prepared statements after database schema changes.
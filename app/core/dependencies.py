@@ -6,29 +6,104 @@ This module provides FastAPI dependencies for:
 - Authentication
 - Current user
 - Authorization
+- Service instances
 """
 
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import defer, make_transient_to_detached
 
+from app.core.cache import is_token_revoked
 from app.core.database import get_db
 from app.core.config import settings
-from app.core.security import decode_token, get_user_id_from_token
+from app.core.security import decode_token, get_user_id_from_token, token_fingerprint
 from app.models.user import User
+from app.repositories.account import AccountRepository
+from app.repositories.base import Cursor
+from app.repositories.user import email_equals
+from app.services.account import AccountService
+from app.services.auth import AuthService
+from app.utils.helpers import decode_cursor
 
 # Security scheme for JWT tokens
 security = HTTPBearer(auto_error=False)
 
+# Challenge header sent with every 401 (shared, never mutated)
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    """Build a 401 with the Bearer challenge header."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers=_BEARER_CHALLENGE,
+    )
+
 
 # Database session dependency - use get_db directly from database module
 get_database_session = get_db
 
+# token fingerprint -> (token exp timestamp, user column values)
+_user_cache: TTLCache[str, Tuple[float, Dict[str, Any]]] = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+
+
+# Columns loaded for the authenticated user; the password hash is never
+# needed past login, so it is neither selected nor cached
+_AUTH_USER_COLUMNS = tuple(
+    column.key for column in User.__table__.columns if column.key != "password_hash"
+)
+
+
+# Per-request user lookup, built once (memoized cache key), without the
+# password hash
+_GET_AUTH_USER_BY_ID = (
+    select(User)
+    .options(defer(User.password_hash, raiseload=True))
+    .where(User.id == bindparam("user_id"))
+)
+
+
+def _user_columns(user: User) -> Dict[str, Any]:
+    """Snapshot a user's column values for the user cache."""
+    return {key: getattr(user, key) for key in _AUTH_USER_COLUMNS}
+
+
+def _user_from_columns(columns: Dict[str, Any]) -> User:
+    """Rebuild a detached User (with identity, not in any session) from a snapshot."""
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return user
+
+
+@lru_cache(maxsize=4096)
+def _parse_user_id(user_id: str) -> UUID:
+    """
+    Parse a token's user ID claim, memoized per claim value.
+    
+    Raises:
+        ValueError: If the claim is not a UUID (errors are not cached)
+    """
+    return UUID(user_id)
+
+
+def forget_cached_token(fingerprint: str) -> None:
+    """Drop a token from the in-process user cache (e.g. on logout)."""
+    _user_cache.pop(fingerprint, None)
+
 
 async def get_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_database_session)
 ) -> User:
@@ -40,66 +115,128 @@ async def get_current_user(
         async def get_profile(current_user: User = Depends(get_current_user)):
             return current_user
     
+    A token that was seen within AUTH_CACHE_TTL_SECONDS is served from an
+    in-process cache, skipping signature verification and the user SELECT.
+    The returned User is then detached from the session.
+    
     Raises:
-        HTTPException: 401 if token is missing, invalid, or user not found
+        HTTPException: 401 if token is missing, invalid, revoked, not an
+            access token, or user not found; 503 if the revoked-token list
+            is unavailable
     """
     if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Not authenticated")
+    
+    token = credentials.credentials
+    fingerprint = token_fingerprint(token)
+    
+    if await is_token_revoked(fingerprint):
+        forget_cached_token(fingerprint)
+        raise _unauthorized("Token has been revoked")
+    
+    cached = _user_cache.get(fingerprint)
+    if cached is not None:
+        expires_at, columns = cached
+        if expires_at > time.time():
+            return _user_from_columns(columns)
+        forget_cached_token(fingerprint)
     
     # Decode token and extract user ID
     try:
-        token = credentials.credentials
         payload = decode_token(token)
+        # Refresh tokens are only good for POST /auth/refresh
+        if payload.get("type") != "access":
+            raise _unauthorized("Invalid token type")
+        # Reused by get_current_account within this request
+        request.state.jwt_payload = payload
         user_id = payload.get("user_id") or payload.get("sub")
         
         if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _unauthorized("Invalid token payload")
         
         # Convert to UUID if it's a string
         try:
-            user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
+            user_uuid = _parse_user_id(user_id) if isinstance(user_id, str) else user_id
         except ValueError:
             # If user_id is email, query by email instead
             email = payload.get("email") or payload.get("sub")
             if not email:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token format",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            stmt = select(User).where(User.email == email)
+                raise _unauthorized("Invalid token format")
+            stmt = (
+                select(User)
+                .options(defer(User.password_hash, raiseload=True))
+                .where(email_equals(email))
+            )
+            params = None
         else:
-            stmt = select(User).where(User.id == user_uuid)
+            stmt = _GET_AUTH_USER_BY_ID
+            params = {"user_id": user_uuid}
         
-        # Query user from database
-        result = await db.execute(stmt)
+        # Query user from database (without the password hash)
+        result = await db.execute(stmt, params)
         user = result.scalar_one_or_none()
         
         if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _unauthorized("User not found")
         
+        _user_cache[fingerprint] = (float(payload.get("exp", 0)), _user_columns(user))
         return user
         
     except HTTPException:
         raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Could not validate credentials: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    except Exception:
+        raise _unauthorized("Could not validate credentials")
+
+
+async def get_current_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> UUID:
+    """
+    Dependency to get the current user's ID without loading the user.
+    
+    Validates the JWT and returns its user ID claim, skipping the users
+    SELECT. Revoked tokens are rejected, and an inactive user is rejected
+    when the user is already in the per-token user cache; otherwise
+    is_active is not checked, so use get_current_active_user wherever
+    that matters.
+    
+    Usage:
+        @router.get("/mine")
+        async def list_mine(user_id: UUID = Depends(get_current_user_id)):
+            ...
+    
+    Raises:
+        HTTPException: 401 if token is missing, invalid, revoked, or not an
+            access token; 403 if the cached user is inactive; 503 if the
+            revoked-token list is unavailable
+    """
+    if not credentials:
+        raise _unauthorized("Not authenticated")
+    
+    token = credentials.credentials
+    fingerprint = token_fingerprint(token)
+    
+    if await is_token_revoked(fingerprint):
+        forget_cached_token(fingerprint)
+        raise _unauthorized("Token has been revoked")
+    
+    cached = _user_cache.get(fingerprint)
+    if cached is not None and cached[0] > time.time():
+        columns = cached[1]
+        if not columns["is_active"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user account"
+            )
+        return columns["id"]
+    
+    payload = decode_token(token)
+    if payload.get("type") != "access":
+        raise _unauthorized("Invalid token type")
+    try:
+        return _parse_user_id(str(payload.get("user_id") or payload.get("sub")))
+    except ValueError:
+        raise _unauthorized("Invalid token payload")
 
 
 async def get_current_active_user(
@@ -114,6 +251,10 @@ async def get_current_active_user(
         async def protected_route(user: User = Depends(get_current_active_user)):
             ...
     
+    Routers that require it on every route declare it in
+    APIRouter(dependencies=[...]); FastAPI caches it per request, so routes
+    that also need the user object get the same instance.
+    
     Raises:
         HTTPException: 403 if user account is inactive
     """
@@ -125,49 +266,29 @@ async def get_current_active_user(
     return current_user
 
 
-async def verify_account_access(
-    account_id: str,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_database_session)
-):
+async def _check_account_access(account_id: UUID, user: User, db: AsyncSession):
     """
-    Dependency to verify user has access to an account.
+    Return the account if user is an active member of it and it is active.
     
-    Usage:
-        @router.get("/missions")
-        async def get_missions(
-            account_id: str = Query(...),
-            _: Account = Depends(verify_account_access(account_id))
-        ):
-            ...
-    """
-    from app.repositories.account_user import AccountUserRepository
-    from app.repositories.account import AccountRepository
-    
-    account_user_repo = AccountUserRepository(db)
-    account_repo = AccountRepository(db)
+    Plain helper shared by the dependencies below, which pass in their
+    already-resolved user and session.
     
-    # Check if user belongs to account
-    account_user = await account_user_repo.get_by_user_and_account(
-        user_id=str(current_user.id),
+    Raises:
+        HTTPException: 403 if the user is not a member or the account is
+            inactive
+    """
+    # Membership and account in one round trip
+    account = await AccountRepository(db).get_for_member(
+        user_id=user.id,
         account_id=account_id
     )
     
-    if not account_user:
+    if not account:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied to this account"
         )
     
-    # Get and validate account
-    account = await account_repo.get_by_id(account_id)
-    
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Account not found"
-        )
-    
     if not account.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -177,7 +298,27 @@ async def verify_account_access(
     return account
 
 
+async def verify_account_access(
+    account_id: UUID,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database_session)
+):
+    """
+    Dependency to verify user has access to an account.
+    
+    Usage:
+        @router.get("/missions")
+        async def get_missions(
+            account_id: UUID = Query(...),
+            _: Account = Depends(verify_account_access(account_id))
+        ):
+            ...
+    """
+    return await _check_account_access(account_id, current_user, db)
+
+
 async def get_current_account(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_database_session)
@@ -186,17 +327,23 @@ async def get_current_account(
     Get current account from JWT token.
     
     Returns the account_id from the JWT token and verifies access.
+    The user usually comes from the per-token user cache, so this costs a
+    single membership/account JOIN; the token payload is reused from
+    get_current_user or served from the payload cache.
     """
     if not credentials:
         return None
     
     try:
-        token = credentials.credentials
-        payload = decode_token(token)
+        # get_current_user leaves the payload on request.state when it
+        # decoded the token; otherwise the user came from the user cache
+        payload = getattr(request.state, "jwt_payload", None)
+        if payload is None:
+            payload = decode_token(credentials.credentials)
         account_id = payload.get("account_id")
         
         if account_id:
-            return await verify_account_access(account_id, current_user, db)
+            return await _check_account_access(UUID(account_id), current_user, db)
     except HTTPException:
         return None
     except Exception:
@@ -204,3 +351,56 @@ async def get_current_account(
     
     return None
 
+
+# ----------------------------------------------------
+# Service Dependencies
+# ----------------------------------------------------
+
+def get_auth_service(
+    db: AsyncSession = Depends(get_database_session)
+) -> AuthService:
+    """
+    Dependency providing an AuthService bound to the request's session.
+    
+    Usage:
+        @router.post("/login")
+        async def login(auth_service: AuthService = Depends(get_auth_service)):
+            ...
+    """
+    return AuthService(db)
+
+
+def get_account_service(
+    db: AsyncSession = Depends(get_database_session)
+) -> AccountService:
+    """
+    Dependency providing an AccountService bound to the request's session.
+    """
+    return AccountService(db)
+
+
+# ----------------------------------------------------
+# Pagination Dependencies
+# ----------------------------------------------------
+
+def get_page_cursor(
+    after: Optional[str] = Query(
+        None,
+        description="Cursor for the next page, taken from the previous response's Link header"
+    )
+) -> Optional[Cursor]:
+    """
+    Dependency to decode a keyset pagination cursor.
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if after is None:
+        return None
+    try:
+        return decode_cursor(after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -0,0 +1,36 @@
+"""
+Identifier Generation Module
+
+This module provides time-ordered UUIDs (UUIDv7, RFC 9562) for primary keys.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7.
+
+    The high 48 bits hold the Unix timestamp in milliseconds and the rest
+    (apart from the version and variant bits) is random, so IDs sort by
+    creation time and new rows land at the right edge of the primary key
+    index instead of on random pages.
+
+    Returns:
+        A version 7 UUID
+
+    Example:
+        >>> uuid7().version
+        7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a (12 bits)
+    value |= 0b10 << 62                         # RFC 4122/9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b (62 bits)
+    return uuid.UUID(int=value)
@@ -7,11 +7,18 @@ This module provides:
 - Token refresh functionality
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import threading
+import time
+from functools import lru_cache
+from datetime import timedelta
 from typing import Optional, Dict, Any
+from cachetools import TLRUCache
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 
@@ -19,6 +26,16 @@ from app.core.config import settings
 # Password Hashing
 # ----------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> bytes:
+    """
+    Hash checked against when there is no real hash (unknown user), so that
+    branch costs as much as a wrong password. Built on first use with the
+    configured work factor.
+    """
+    return bcrypt.hashpw(b"timing-equalizer", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
+
+
 def hash_password(password: str) -> str:
     """
     Hash a plain text password using bcrypt.
@@ -37,8 +54,8 @@ def hash_password(password: str) -> str:
     # Convert password to bytes
     password_bytes = password.encode('utf-8')
     
-    # Generate salt and hash password
-    salt = bcrypt.gensalt()
+    # Generate salt (BCRYPT_ROUNDS work factor) and hash password
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     
     # Return as string (bcrypt hash is already a string when decoded)
@@ -59,7 +76,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Example:
         >>> verify_password("my_password", "$2b$12$...")
         True
+    
+    An empty hashed_password (e.g. the user does not exist) still runs a
+    full bcrypt check before returning False, so response time does not
+    reveal whether an account exists.
     """
+    if not hashed_password:
+        bcrypt.checkpw(plain_password.encode('utf-8'), _dummy_password_hash())
+        return False
+    
     try:
         # Convert to bytes
         password_bytes = plain_password.encode('utf-8')
@@ -71,10 +96,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the worker threadpool.
+    
+    bcrypt takes hundreds of milliseconds at the default work factor; use
+    this from request handlers so the event loop is not blocked.
+    """
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the worker threadpool (see hash_password_async).
+    """
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
 # ----------------------------------------------------
 # JWT Token Management
 # ----------------------------------------------------
 
+# Token lifetimes in seconds; exp/iat are POSIX timestamps, as in the JWT spec
+_ACCESS_TOKEN_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -91,14 +137,12 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     """
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_TTL
+    now = int(time.time())
     
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + ttl,
+        "iat": now,
         "type": "access"
     })
     
@@ -125,11 +169,11 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         >>> refresh_token = create_refresh_token({"sub": "user@example.com", "user_id": str(user.id)})
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now = int(time.time())
     
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + _REFRESH_TOKEN_TTL,
+        "iat": now,
         "type": "refresh"
     })
     
@@ -142,10 +186,29 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+def _payload_ttu(_key: str, payload: Dict[str, Any], now: float) -> float:
+    """Cache a payload for AUTH_CACHE_TTL_SECONDS, but never past the token's exp."""
+    remaining = float(payload.get("exp", 0)) - time.time()
+    return now + min(settings.AUTH_CACHE_TTL_SECONDS, remaining)
+
+
+# token fingerprint -> verified payload. Only successful decodes are cached,
+# so invalid and expired tokens are always re-verified.
+_payload_cache: TLRUCache[str, Dict[str, Any]] = TLRUCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttu=_payload_ttu
+)
+_payload_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT token.
     
+    Verified payloads are cached per token until the earlier of
+    AUTH_CACHE_TTL_SECONDS and the token's expiry, so repeat requests with
+    the same bearer token skip signature verification.
+    
     Args:
         token: JWT token string
         
@@ -159,19 +222,41 @@ def decode_token(token: str) -> Dict[str, Any]:
         >>> payload = decode_token(token)
         >>> user_id = payload.get("user_id")
     """
+    key = token_fingerprint(token)
+    with _payload_cache_lock:
+        cached = _payload_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    with _payload_cache_lock:
+        _payload_cache[key] = payload
+    return dict(payload)
+
+
+def token_fingerprint(token: str) -> str:
+    """
+    Short stable digest of a JWT, used as a cache / revocation key.
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        32-character hex digest
+    """
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def get_user_id_from_token(token: str) -> Optional[str]:
@@ -280,7 +365,7 @@ def verify_token_type(token: str, expected_type: str = "access") -> bool:
     try:
         payload = decode_token(token)
         token_type = payload.get("type")
-        return token_type == expected_type
+        return hmac.compare_digest(str(token_type or ""), expected_type)
     except HTTPException:
         return False
 
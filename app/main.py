@@ -10,12 +10,14 @@ This module initializes the FastAPI application with:
 
 import logging
 from contextlib import asynccontextmanager
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from app.core.cache import init_cache
 from app.core.config import settings
-from app.core.database import DatabaseManager, check_db_connection
+from app.core.database import DatabaseManager, check_db_connection, check_db_connection_cached, prewarm_pool
 from app.api.router import api_router
 from app.middleware.logging import LoggingMiddleware
 
@@ -34,6 +36,9 @@ async def lifespan(app: FastAPI):
     
     Startup:
     - Initialize database extensions if needed
+    - Prewarm the connection pool
+    - Initialize the response cache
+    - Size the worker threadpool
     
     Shutdown:
     - Clean up resources
@@ -43,6 +48,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.DEBUG}")
     
     # Check database connection on startup
+    is_healthy = False
     try:
         is_healthy = await check_db_connection()
         if is_healthy:
@@ -52,6 +58,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Database connection error on startup: {e}")
     
+    if settings.DB_POOL_PREWARM and is_healthy:
+        await prewarm_pool()
+    
+    init_cache()
+    
+    # bcrypt and sync dependencies run in this pool (default 40 threads)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
     yield
     
     # Shutdown
@@ -65,6 +79,7 @@ app = FastAPI(
     version="1.0.0",
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
 )
@@ -74,6 +89,13 @@ app = FastAPI(
 # Middleware Configuration
 # ----------------------------------------------------
 
+# Middleware added last runs first, so CORS is registered last: it answers
+# preflight OPTIONS requests itself before they reach logging or routing
+
+# Request Logging Middleware
+if settings.DEBUG:
+    app.add_middleware(LoggingMiddleware)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -83,10 +105,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request Logging Middleware
-if settings.DEBUG:
-    app.add_middleware(LoggingMiddleware)
-
 
 # ----------------------------------------------------
 # Health Check Endpoints
@@ -104,9 +122,9 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint for monitoring."""
+    """Health check endpoint for monitoring (database result cached briefly)."""
     try:
-        db_healthy = await check_db_connection()
+        db_healthy = await check_db_connection_cached()
         return {
             "status": "healthy" if db_healthy else "degraded",
             "database": "connected" if db_healthy else "disconnected"
@@ -131,9 +149,9 @@ async def liveness_probe():
 
 @app.get("/health/ready", tags=["Health"])
 async def readiness_probe():
-    """Kubernetes readiness probe endpoint."""
+    """Kubernetes readiness probe endpoint (database result cached briefly)."""
     try:
-        db_ready = await check_db_connection()
+        db_ready = await check_db_connection_cached()
         if db_ready:
             return {"status": "ready"}
         else:
@@ -17,26 +17,33 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next):
         """Log request and response details."""
-        start_time = time.time()
+        # Skip all formatting work when INFO is disabled for this logger
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(request)
         
-        # Log request
+        start_time = time.perf_counter()
+        
+        # Log request (arguments are formatted lazily by logging)
         logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Client: {request.client.host if request.client else 'unknown'}"
+            "%s %s - Client: %s",
+            request.method,
+            request.url.path,
+            request.client.host if request.client else "unknown",
         )
         
         # Process request
         response = await call_next(request)
         
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         # Log response
         logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Duration: {duration:.3f}s"
+            "%s %s - Status: %s - Duration: %.3fs",
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration,
         )
         
         return response
-
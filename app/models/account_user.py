@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, DateTime
+from sqlalchemy import Column, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -6,6 +6,23 @@ from app.models.base import BaseModel
 
 class AccountUser(BaseModel):
     __tablename__ = "account_users"
+    __table_args__ = (
+        # One active membership per user and account
+        Index(
+            "ix_account_users_active",
+            "user_id",
+            "account_id",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Active members of an account
+        Index(
+            "ix_account_users_account_active",
+            "account_id",
+            "user_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
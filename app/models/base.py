@@ -2,7 +2,7 @@
 Base Model Module
 
 This module provides a base class for all SQLAlchemy models with common fields:
-- id: Primary key (UUID)
+- id: Primary key (UUIDv7)
 - created_at: Timestamp when record was created
 - updated_at: Timestamp when record was last updated
 
@@ -12,13 +12,13 @@ Key Concepts:
 3. Automatic Timestamps - Uses server_default and onupdate for automatic timestamps
 """
 
-import uuid
 from datetime import datetime
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 
 # Import the Base from your database module
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class BaseModel(Base):
@@ -26,7 +26,7 @@ class BaseModel(Base):
     Abstract base model class that provides common fields for all models.
     
     Attributes:
-        id (UUID): Primary key, auto-generated UUID
+        id (UUID): Primary key, auto-generated time-ordered UUID (v7)
         created_at (DateTime): Timestamp set automatically when record is created
         updated_at (DateTime): Timestamp updated automatically when record is modified
     
@@ -40,15 +40,18 @@ class BaseModel(Base):
     
     # This makes the class abstract - no table will be created for BaseModel itself
     __abstract__ = True
-    
-    # Primary Key - UUID for better security and distributed systems
+
+    # Fetch server-generated values (created_at, updated_at) with RETURNING
+    # during flush, so new and updated rows never need a refresh() SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Primary Key - time-ordered UUIDv7 so inserts append to the index
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,  # Python-side default
-        server_default=func.gen_random_uuid(),  # Database-side default (requires pgcrypto)
-        nullable=False,
-        index=True
+        default=uuid7,  # Python-side default (time-ordered)
+        server_default=func.gen_random_uuid(),  # Fallback for raw SQL inserts (requires pgcrypto)
+        nullable=False
     )
     
     # Created timestamp - set once when record is created
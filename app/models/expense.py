@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -6,6 +6,32 @@ from app.models.base import BaseModel
 
 class Expense(BaseModel):
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Active expenses for a mission, newest first
+        Index(
+            "ix_expenses_mission_keyset",
+            "mission_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Active expenses recorded by a user, newest first
+        Index(
+            "ix_expenses_user_keyset",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Active expenses for an account, newest first
+        Index(
+            "ix_expenses_account_active",
+            "account_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        CheckConstraint("amount > 0", name="expenses_amount_positive"),
+    )
 
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     mission_id = Column(UUID(as_uuid=True), ForeignKey("missions.id"), nullable=True) # Nullable for account-level expenses
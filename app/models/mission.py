@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, JSON, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -6,6 +6,27 @@ from app.models.base import BaseModel
 
 class Mission(BaseModel):
     __tablename__ = "missions"
+    __table_args__ = (
+        # Active missions for an account, newest first
+        Index(
+            "ix_missions_account_keyset",
+            "account_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Active missions created by a user, newest first
+        Index(
+            "ix_missions_creator_active",
+            "created_by",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        CheckConstraint(
+            "end_date IS NULL OR start_date IS NULL OR end_date >= start_date",
+            name="missions_date_range",
+        ),
+    )
 
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     name = Column(String(255), nullable=False)
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, ForeignKey, DateTime, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -14,6 +14,16 @@ class MissionRole(str, enum.Enum):
 
 class MissionUser(BaseModel):
     __tablename__ = "mission_users"
+    __table_args__ = (
+        # One active assignment per user and mission
+        Index(
+            "ix_mission_users_active",
+            "mission_id",
+            "user_id",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     mission_id = Column(UUID(as_uuid=True), ForeignKey("missions.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -6,6 +6,23 @@ from app.models.base import BaseModel
 
 class OutreachData(BaseModel):
     __tablename__ = "outreach_data"
+    __table_args__ = (
+        # Active outreach data for a mission, newest first
+        Index(
+            "ix_outreach_data_mission_keyset",
+            "mission_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Active outreach data for an account, newest first
+        Index(
+            "ix_outreach_data_account_active",
+            "account_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False, index=True)
     mission_id = Column(UUID(as_uuid=True), ForeignKey("missions.id"), nullable=False, index=True)
@@ -24,6 +41,15 @@ class OutreachData(BaseModel):
 
 class OutreachNumbers(BaseModel):
     __tablename__ = "outreach_numbers"
+    __table_args__ = (
+        # Active outreach numbers for an account, newest first
+        Index(
+            "ix_outreach_numbers_account_active",
+            "account_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False, index=True)
     mission_id = Column(UUID(as_uuid=True), ForeignKey("missions.id"), unique=True, nullable=False, index=True)
@@ -1,13 +1,18 @@
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Index, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive, byte-wise login lookups and uniqueness
+        # (see app.repositories.user.email_equals)
+        Index("ix_users_email_lower", text('lower(email) COLLATE "C"'), unique=True),
+    )
 
     full_name = Column(String(255), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    email = Column(String(255), unique=True, nullable=False)
     phone_number = Column(String(50), nullable=True)
     password_hash = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
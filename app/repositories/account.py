@@ -4,18 +4,96 @@ Account Repository
 Repository for account database operations.
 """
 
-from typing import Optional
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.models.account import Account
+from app.models.account_user import AccountUser
 from app.repositories.base import BaseRepository
 
+# Built once: a module-level statement reuses its memoized cache key instead
+# of rebuilding the clause tree on every access check
+_GET_ACCOUNT_FOR_MEMBER = (
+    select(Account)
+    .join(AccountUser, AccountUser.account_id == Account.id)
+    .where(
+        AccountUser.user_id == bindparam("user_id"),
+        AccountUser.account_id == bindparam("account_id"),
+        AccountUser.deleted_at.is_(None)
+    )
+)
+
 
 class AccountRepository(BaseRepository[Account]):
     """Repository for Account model operations."""
     
     def __init__(self, db: AsyncSession):
         super().__init__(Account, db)
-
+    
+    async def get_for_member(
+        self,
+        user_id: UUID,
+        account_id: UUID
+    ) -> Optional[Account]:
+        """
+        Get an account (active or not) if the user is an active member of it.
+        
+        Args:
+            user_id: User UUID
+            account_id: Account UUID
+            
+        Returns:
+            Account instance, or None if there is no such membership
+        """
+        result = await self.db.execute(
+            _GET_ACCOUNT_FOR_MEMBER,
+            {"user_id": user_id, "account_id": account_id}
+        )
+        return result.scalar_one_or_none()
+    
+    async def get_active_for_user(self, user_id: UUID) -> List[Account]:
+        """
+        Get all active accounts a user is an active member of.
+        
+        Args:
+            user_id: User UUID
+            
+        Returns:
+            List of Account instances
+        """
+        stmt = (
+            select(Account)
+            .join(AccountUser, AccountUser.account_id == Account.id)
+            .where(
+                AccountUser.user_id == user_id,
+                AccountUser.deleted_at.is_(None),
+                Account.is_active.is_(True)
+            )
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def get_memberships_for_user(self, user_id: UUID) -> List[Tuple[Account, UUID]]:
+        """
+        Get every active account a user is an active member of, with the
+        user's role in it, in one JOIN.
+        
+        Args:
+            user_id: User UUID
+            
+        Returns:
+            List of (Account instance, role UUID) tuples
+        """
+        stmt = (
+            select(Account, AccountUser.role_id)
+            .join(AccountUser, AccountUser.account_id == Account.id)
+            .where(
+                AccountUser.user_id == user_id,
+                AccountUser.deleted_at.is_(None),
+                Account.is_active.is_(True)
+            )
+        )
+        result = await self.db.execute(stmt)
+        return list(result.tuples().all())
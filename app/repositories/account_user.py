@@ -4,14 +4,23 @@ AccountUser Repository
 Repository for account_user database operations.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Load
 
 from app.models.account_user import AccountUser
 from app.repositories.base import BaseRepository
 
+# Built once so each lookup reuses the statement's memoized cache key
+_GET_BY_USER_AND_ACCOUNT = select(AccountUser).where(
+    AccountUser.user_id == bindparam("user_id"),
+    AccountUser.account_id == bindparam("account_id"),
+    AccountUser.deleted_at.is_(None)  # Only active relationships
+)
+
 
 class AccountUserRepository(BaseRepository[AccountUser]):
     """Repository for AccountUser model operations."""
@@ -19,22 +28,16 @@ class AccountUserRepository(BaseRepository[AccountUser]):
     def __init__(self, db: AsyncSession):
         super().__init__(AccountUser, db)
     
-    async def get_by_user_id(self, user_id: UUID | str) -> List[AccountUser]:
+    async def get_by_user_id(self, user_id: UUID) -> List[AccountUser]:
         """
         Get all account-user relationships for a user.
         
         Args:
-            user_id: User UUID (as UUID or string)
+            user_id: User UUID
             
         Returns:
             List of AccountUser instances
         """
-        if isinstance(user_id, str):
-            try:
-                user_id = UUID(user_id)
-            except ValueError:
-                return []
-        
         stmt = select(AccountUser).where(
             AccountUser.user_id == user_id,
             AccountUser.deleted_at.is_(None)  # Only active relationships
@@ -42,22 +45,16 @@ class AccountUserRepository(BaseRepository[AccountUser]):
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
-    async def get_by_account_id(self, account_id: UUID | str) -> List[AccountUser]:
+    async def get_by_account_id(self, account_id: UUID) -> List[AccountUser]:
         """
         Get all account-user relationships for an account.
         
         Args:
-            account_id: Account UUID (as UUID or string)
+            account_id: Account UUID
             
         Returns:
             List of AccountUser instances
         """
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return []
-        
         stmt = select(AccountUser).where(
             AccountUser.account_id == account_id,
             AccountUser.deleted_at.is_(None)  # Only active relationships
@@ -67,62 +64,101 @@ class AccountUserRepository(BaseRepository[AccountUser]):
     
     async def get_by_user_and_account(
         self,
-        user_id: UUID | str,
-        account_id: UUID | str
+        user_id: UUID,
+        account_id: UUID,
+        options: Sequence[Load] = ()
     ) -> Optional[AccountUser]:
         """
         Get account-user relationship for specific user and account.
         
         Args:
-            user_id: User UUID (as UUID or string)
-            account_id: Account UUID (as UUID or string)
+            user_id: User UUID
+            account_id: Account UUID
+            options: Loader options, e.g. joinedload(AccountUser.role)
             
         Returns:
             AccountUser instance or None if not found
         """
-        if isinstance(user_id, str):
-            try:
-                user_id = UUID(user_id)
-            except ValueError:
-                return None
-        
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return None
+        stmt = _GET_BY_USER_AND_ACCOUNT
+        if options:
+            stmt = stmt.options(*options)
+        result = await self.db.execute(stmt, {"user_id": user_id, "account_id": account_id})
+        return result.scalar_one_or_none()
+    
+    async def exists_for_user_and_account(
+        self,
+        user_id: UUID,
+        account_id: UUID
+    ) -> bool:
+        """
+        Check whether a user is an active member of an account.
         
-        stmt = select(AccountUser).where(
+        Args:
+            user_id: User UUID
+            account_id: Account UUID
+            
+        Returns:
+            True if an active relationship exists, False otherwise
+        """
+        stmt = select(exists().where(
             AccountUser.user_id == user_id,
             AccountUser.account_id == account_id,
             AccountUser.deleted_at.is_(None)  # Only active relationships
-        )
+        ))
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
+    
+    async def create_if_absent(
+        self,
+        account_id: UUID,
+        user_id: UUID,
+        role_id: UUID
+    ) -> bool:
+        """
+        Create an account-user relationship unless an active one exists.
+        
+        A single INSERT ... ON CONFLICT DO NOTHING against the partial unique
+        index ix_account_users_active (one active membership per user and
+        account), so the check and the insert cannot race.
+        
+        Args:
+            account_id: Account UUID
+            user_id: User UUID
+            role_id: Role UUID
+            
+        Returns:
+            True if the relationship was created, False if the user was
+            already an active member
+        """
+        stmt = insert(AccountUser).values(
+            account_id=account_id,
+            user_id=user_id,
+            role_id=role_id
+        ).on_conflict_do_nothing(
+            index_elements=[AccountUser.user_id, AccountUser.account_id],
+            index_where=AccountUser.deleted_at.is_(None)
+        ).returning(AccountUser.id)
+        
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
     
     async def create(
         self,
-        account_id: UUID | str,
-        user_id: UUID | str,
-        role_id: UUID | str
+        account_id: UUID,
+        user_id: UUID,
+        role_id: UUID
     ) -> AccountUser:
         """
         Create a new account-user relationship.
         
         Args:
-            account_id: Account UUID (as UUID or string)
-            user_id: User UUID (as UUID or string)
-            role_id: Role UUID (as UUID or string)
+            account_id: Account UUID
+            user_id: User UUID
+            role_id: Role UUID
             
         Returns:
             Created AccountUser instance
         """
-        if isinstance(account_id, str):
-            account_id = UUID(account_id)
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
-        if isinstance(role_id, str):
-            role_id = UUID(role_id)
         
         account_user = AccountUser(
             account_id=account_id,
@@ -131,5 +167,4 @@ class AccountUserRepository(BaseRepository[AccountUser]):
         )
         self.db.add(account_user)
         await self.db.flush()
-        await self.db.refresh(account_user)
         return account_user
@@ -4,17 +4,34 @@ Base Repository
 Abstract base class for repository pattern implementation.
 """
 
-from typing import Generic, TypeVar, Optional, List, Type
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Generic, Iterable, Sequence, TypeVar, Optional, List, Tuple, Type
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, insert, update, delete, func, tuple_, Select
+from sqlalchemy.orm import Load, selectinload
 
 from app.models.base import BaseModel
 
+# Keyset pagination position: (created_at, id) of the last row already seen
+Cursor = Tuple[datetime, UUID]
+
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _by_id_query(model: Type[BaseModel]) -> Select:
+    """SELECT of a model by primary key, built once per class (memoized cache key)."""
+    return select(model).where(model.id == bindparam("id"))
+
+
+@lru_cache(maxsize=None)
+def _column_keys(model: Type[BaseModel]) -> frozenset:
+    """Mapped column attribute names of a model, resolved once per class."""
+    return frozenset(model.__mapper__.column_attrs.keys())
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Base repository class providing common CRUD operations.
@@ -36,26 +53,56 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
-    async def get_by_id(self, id: UUID | str) -> Optional[ModelType]:
+    async def get_by_id(
+        self,
+        id: UUID,
+        options: Sequence[Load] = ()
+    ) -> Optional[ModelType]:
         """
         Get a record by ID.
         
+        A row this session already loaded (e.g. the account fetched by an
+        access-check dependency earlier in the request) is returned from the
+        session's identity map without a query.
+        
         Args:
-            id: Record UUID (as UUID or string)
+            id: Record UUID
+            options: Loader options, e.g. selectinload() for relationships
+                the caller will access
             
         Returns:
             Model instance or None if not found
         """
-        if isinstance(id, str):
-            try:
-                id = UUID(id)
-            except ValueError:
-                return None
+        # Session.get ignores loader options for an instance it already
+        # holds, so only option-free lookups go through the identity map
+        if not options:
+            return await self.db.get(self.model, id)
         
-        stmt = select(self.model).where(self.model.id == id)
-        result = await self.db.execute(stmt)
+        stmt = _by_id_query(self.model).options(*options)
+        result = await self.db.execute(stmt, {"id": id})
         return result.scalar_one_or_none()
     
+    async def get_many(self, ids: Iterable[UUID], *criteria) -> Dict[UUID, ModelType]:
+        """
+        Get records for many IDs in a single IN (...) query.
+        
+        Use this instead of calling get_by_id in a loop.
+        
+        Args:
+            ids: Record UUIDs
+            *criteria: Extra WHERE clauses
+            
+        Returns:
+            Dictionary of ID -> model instance for the records found
+        """
+        uuids = set(ids)
+        if not uuids:
+            return {}
+        
+        stmt = select(self.model).where(self.model.id.in_(uuids), *criteria)
+        result = await self.db.execute(stmt)
+        return {instance.id: instance for instance in result.scalars().all()}
+    
     async def get_by_email(self, email: str) -> Optional[ModelType]:
         """
         Get a record by email (if model has email field).
@@ -73,11 +120,19 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    def _column_filters(self, filters: Optional[dict]) -> dict:
+        """Keep only the filters that name a mapped column; others are ignored."""
+        if not filters:
+            return {}
+        columns = _column_keys(self.model)
+        return {field: value for field, value in filters.items() if field in columns}
+    
     async def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
-        filters: Optional[dict] = None
+        filters: Optional[dict] = None,
+        options: Sequence[Load] = ()
     ) -> List[ModelType]:
         """
         Get all records with pagination and optional filters.
@@ -86,22 +141,52 @@ class BaseRepository(Generic[ModelType]):
             skip: Number of records to skip
             limit: Maximum number of records to return
             filters: Dictionary of field: value filters
+            options: Loader options, e.g. selectinload() for relationships
+                the caller will access
             
         Returns:
             List of model instances
         """
-        stmt = select(self.model)
-        
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
-        
-        stmt = stmt.offset(skip).limit(limit)
+        stmt = (
+            select(self.model)
+            .options(*options)
+            .filter_by(**self._column_filters(filters))
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def _paginate(
+        self,
+        stmt: Select,
+        skip: int,
+        limit: int,
+        after: Optional[Cursor] = None
+    ) -> Select:
+        """
+        Apply newest-first ordering and a page window to a query.
+        
+        With a cursor, rows strictly after it in (created_at, id) order are
+        returned (keyset pagination) and skip is ignored; otherwise the
+        deprecated OFFSET-based skip is used.
+        
+        Args:
+            stmt: Select statement over self.model
+            skip: Number of records to skip (ignored when after is given)
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last row of the previous page
+            
+        Returns:
+            Paginated select statement
+        """
+        if after is not None:
+            stmt = stmt.where(tuple_(self.model.created_at, self.model.id) < after)
+        else:
+            stmt = stmt.offset(skip)
+        
+        return stmt.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit)
+    
     async def create(self, **kwargs) -> ModelType:
         """
         Create a new record.
@@ -115,64 +200,88 @@ class BaseRepository(Generic[ModelType]):
         instance = self.model(**kwargs)
         self.db.add(instance)
         await self.db.flush()
-        await self.db.refresh(instance)
         return instance
     
-    async def update(self, id: UUID | str, **kwargs) -> Optional[ModelType]:
+    async def create_many(self, rows: Sequence[dict]) -> List[ModelType]:
+        """
+        Create many records with one bulk INSERT ... RETURNING.
+        
+        Rows are sent as a single multi-row statement (insertmanyvalues)
+        instead of one flush per row. Does not commit; the caller owns the
+        transaction.
+        
+        Args:
+            rows: Model field values, one dictionary per record
+            
+        Returns:
+            Created model instances, in the order of rows
+        """
+        if not rows:
+            return []
+        
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.db.scalars(stmt, list(rows))
+        return list(result.all())
+    
+    async def update(self, id: UUID, **kwargs) -> Optional[ModelType]:
         """
         Update a record by ID.
         
+        Does not commit; the caller owns the transaction.
+        
         Args:
-            id: Record UUID (as UUID or string)
+            id: Record UUID
             **kwargs: Fields to update
             
         Returns:
             Updated model instance or None if not found
         """
-        if isinstance(id, str):
-            try:
-                id = UUID(id)
-            except ValueError:
-                return None
-        
         # Remove None values
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
         
         if not kwargs:
             return await self.get_by_id(id)
         
+        # RETURNING hands back the updated row in the same round trip;
+        # populate_existing refreshes an instance already in the identity map
         stmt = (
             update(self.model)
             .where(self.model.id == id)
             .values(**kwargs)
-            .execution_options(synchronize_session="fetch")
+            .returning(self.model)
         )
-        await self.db.execute(stmt)
-        await self.db.commit()
-        
-        return await self.get_by_id(id)
+        result = await self.db.execute(
+            stmt,
+            execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        return result.scalar_one_or_none()
     
-    async def delete(self, id: UUID | str) -> bool:
+    async def delete(self, id: UUID) -> bool:
         """
         Delete a record by ID.
         
+        Models with a deleted_at column are soft-deleted (deleted_at is set
+        to now() if not already set); others are removed with DELETE.
+        Does not commit; the caller owns the transaction.
+        
         Args:
-            id: Record UUID (as UUID or string)
+            id: Record UUID
             
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found (or already soft-deleted)
         """
-        if isinstance(id, str):
-            try:
-                id = UUID(id)
-            except ValueError:
-                return False
+        if "deleted_at" in _column_keys(self.model):
+            stmt = (
+                update(self.model)
+                .where(self.model.id == id, self.model.deleted_at.is_(None))
+                .values(deleted_at=func.now())
+                .returning(self.model.id)
+            )
+        else:
+            stmt = delete(self.model).where(self.model.id == id).returning(self.model.id)
         
-        stmt = delete(self.model).where(self.model.id == id)
-        result = await self.db.execute(stmt)
-        await self.db.commit()
-        
-        return result.rowcount > 0
+        result = await self.db.execute(stmt, execution_options={"synchronize_session": False})
+        return result.scalar_one_or_none() is not None
     
     async def count(self, filters: Optional[dict] = None) -> int:
         """
@@ -184,14 +293,11 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of records
         """
-        from sqlalchemy import func
-        
-        stmt = select(func.count()).select_from(self.model)
-        
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
+        stmt = (
+            select(func.count())
+            .select_from(self.model)
+            .filter_by(**self._column_filters(filters))
+        )
         
         result = await self.db.execute(stmt)
         return result.scalar() or 0
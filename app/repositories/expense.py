@@ -7,10 +7,11 @@ Repository for expense database operations.
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, Select
+from sqlalchemy.orm import raiseload
 
 from app.models.expense import Expense
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Cursor
 
 
 class ExpenseRepository(BaseRepository[Expense]):
@@ -19,44 +20,53 @@ class ExpenseRepository(BaseRepository[Expense]):
     def __init__(self, db: AsyncSession):
         super().__init__(Expense, db)
     
+    def _by_mission_query(
+        self,
+        mission_id: UUID,
+        skip: int,
+        limit: int,
+        include_deleted: bool,
+        after: Optional[Cursor] = None
+    ) -> Select:
+        """Build the expenses-by-mission query."""
+        stmt = (
+            select(Expense)
+            .options(raiseload("*"))
+            .where(Expense.mission_id == mission_id)
+        )
+        
+        if not include_deleted:
+            stmt = stmt.where(Expense.deleted_at.is_(None))
+        
+        return self._paginate(stmt, skip, limit, after)
+    
     async def get_by_mission(
         self,
-        mission_id: UUID | str,
+        mission_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[Cursor] = None
     ) -> List[Expense]:
         """Get expenses for a mission."""
-        if isinstance(mission_id, str):
-            try:
-                mission_id = UUID(mission_id)
-            except ValueError:
-                return []
-        
-        stmt = select(Expense).where(Expense.mission_id == mission_id)
-        
-        if not include_deleted:
-            stmt = stmt.where(Expense.deleted_at.is_(None))
+        stmt = self._by_mission_query(mission_id, skip, limit, include_deleted, after)
         
-        stmt = stmt.offset(skip).limit(limit).order_by(Expense.created_at.desc())
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
     async def get_by_account(
         self,
-        account_id: UUID | str,
+        account_id: UUID,
         skip: int = 0,
         limit: int = 100,
         include_deleted: bool = False
     ) -> List[Expense]:
         """Get expenses for an account."""
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return []
-        
-        stmt = select(Expense).where(Expense.account_id == account_id)
+        stmt = (
+            select(Expense)
+            .options(raiseload("*"))
+            .where(Expense.account_id == account_id)
+        )
         
         if not include_deleted:
             stmt = stmt.where(Expense.deleted_at.is_(None))
@@ -65,26 +75,30 @@ class ExpenseRepository(BaseRepository[Expense]):
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def _by_user_query(
+        self,
+        user_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Cursor] = None
+    ) -> Select:
+        """Build the expenses-by-user query."""
+        stmt = (
+            select(Expense)
+            .options(raiseload("*"))
+            .where(and_(Expense.user_id == user_id, Expense.deleted_at.is_(None)))
+        )
+        return self._paginate(stmt, skip, limit, after)
+    
     async def get_by_user(
         self,
-        user_id: UUID | str,
+        user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Cursor] = None
     ) -> List[Expense]:
         """Get expenses created by a user."""
-        if isinstance(user_id, str):
-            try:
-                user_id = UUID(user_id)
-            except ValueError:
-                return []
+        stmt = self._by_user_query(user_id, skip, limit, after)
         
-        stmt = (
-            select(Expense)
-            .where(and_(Expense.user_id == user_id, Expense.deleted_at.is_(None)))
-            .offset(skip)
-            .limit(limit)
-            .order_by(Expense.created_at.desc())
-        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
-
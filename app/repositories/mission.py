@@ -7,10 +7,11 @@ Repository for mission database operations.
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, Select
+from sqlalchemy.orm import raiseload
 
 from app.models.mission import Mission
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Cursor
 
 
 class MissionRepository(BaseRepository[Mission]):
@@ -19,12 +20,33 @@ class MissionRepository(BaseRepository[Mission]):
     def __init__(self, db: AsyncSession):
         super().__init__(Mission, db)
     
+    def _by_account_query(
+        self,
+        account_id: UUID,
+        skip: int,
+        limit: int,
+        include_deleted: bool,
+        after: Optional[Cursor] = None
+    ) -> Select:
+        """Build the missions-by-account query."""
+        stmt = (
+            select(Mission)
+            .options(raiseload("*"))
+            .where(Mission.account_id == account_id)
+        )
+        
+        if not include_deleted:
+            stmt = stmt.where(Mission.deleted_at.is_(None))
+        
+        return self._paginate(stmt, skip, limit, after)
+    
     async def get_by_account(
         self,
-        account_id: UUID | str,
+        account_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[Cursor] = None
     ) -> List[Mission]:
         """
         Get missions for an account.
@@ -34,40 +56,26 @@ class MissionRepository(BaseRepository[Mission]):
             skip: Number of records to skip
             limit: Maximum number of records
             include_deleted: Whether to include deleted missions
+            after: Keyset cursor (created_at, id) of the previous page's last row
             
         Returns:
             List of Mission instances
         """
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return []
+        stmt = self._by_account_query(account_id, skip, limit, include_deleted, after)
         
-        stmt = select(Mission).where(Mission.account_id == account_id)
-        
-        if not include_deleted:
-            stmt = stmt.where(Mission.deleted_at.is_(None))
-        
-        stmt = stmt.offset(skip).limit(limit).order_by(Mission.created_at.desc())
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
     async def get_by_creator(
         self,
-        user_id: UUID | str,
+        user_id: UUID,
         skip: int = 0,
         limit: int = 100
     ) -> List[Mission]:
         """Get missions created by a user."""
-        if isinstance(user_id, str):
-            try:
-                user_id = UUID(user_id)
-            except ValueError:
-                return []
-        
         stmt = (
             select(Mission)
+            .options(raiseload("*"))
             .where(and_(Mission.created_by == user_id, Mission.deleted_at.is_(None)))
             .offset(skip)
             .limit(limit)
@@ -7,10 +7,12 @@ Repository for outreach database operations.
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, Select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import raiseload
 
 from app.models.outreach import OutreachData, OutreachNumbers
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Cursor
 
 
 class OutreachDataRepository(BaseRepository[OutreachData]):
@@ -19,44 +21,50 @@ class OutreachDataRepository(BaseRepository[OutreachData]):
     def __init__(self, db: AsyncSession):
         super().__init__(OutreachData, db)
     
+    def _by_mission_query(
+        self,
+        mission_id: UUID,
+        skip: int,
+        limit: int,
+        include_deleted: bool,
+        after: Optional[Cursor] = None
+    ) -> Select:
+        """Build the outreach-data-by-mission query."""
+        stmt = (
+            select(OutreachData)
+            .options(raiseload("*"))
+            .where(OutreachData.mission_id == mission_id)
+        )
+        
+        if not include_deleted:
+            stmt = stmt.where(OutreachData.deleted_at.is_(None))
+        
+        return self._paginate(stmt, skip, limit, after)
+    
     async def get_by_mission(
         self,
-        mission_id: UUID | str,
+        mission_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[Cursor] = None
     ) -> List[OutreachData]:
         """Get outreach data for a mission."""
-        if isinstance(mission_id, str):
-            try:
-                mission_id = UUID(mission_id)
-            except ValueError:
-                return []
-        
-        stmt = select(OutreachData).where(OutreachData.mission_id == mission_id)
-        
-        if not include_deleted:
-            stmt = stmt.where(OutreachData.deleted_at.is_(None))
+        stmt = self._by_mission_query(mission_id, skip, limit, include_deleted, after)
         
-        stmt = stmt.offset(skip).limit(limit).order_by(OutreachData.created_at.desc())
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
     async def get_by_account(
         self,
-        account_id: UUID | str,
+        account_id: UUID,
         skip: int = 0,
         limit: int = 100
     ) -> List[OutreachData]:
         """Get outreach data for an account."""
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return []
-        
         stmt = (
             select(OutreachData)
+            .options(raiseload("*"))
             .where(and_(OutreachData.account_id == account_id, OutreachData.deleted_at.is_(None)))
             .offset(skip)
             .limit(limit)
@@ -74,15 +82,9 @@ class OutreachNumbersRepository(BaseRepository[OutreachNumbers]):
     
     async def get_by_mission(
         self,
-        mission_id: UUID | str
+        mission_id: UUID
     ) -> Optional[OutreachNumbers]:
         """Get outreach numbers for a mission (one-to-one relationship)."""
-        if isinstance(mission_id, str):
-            try:
-                mission_id = UUID(mission_id)
-            except ValueError:
-                return None
-        
         stmt = select(OutreachNumbers).where(
             and_(
                 OutreachNumbers.mission_id == mission_id,
@@ -92,21 +94,63 @@ class OutreachNumbersRepository(BaseRepository[OutreachNumbers]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def upsert_for_mission(
+        self,
+        account_id: UUID,
+        mission_id: UUID,
+        interested: int,
+        heared: int,
+        saved: int
+    ) -> OutreachNumbers:
+        """
+        Insert or overwrite the outreach numbers for a mission in one statement.
+        
+        Relies on the unique index on mission_id: a concurrent insert for the
+        same mission becomes an update instead of an IntegrityError. A
+        soft-deleted row for the mission is restored.
+        
+        Args:
+            account_id: Account UUID (used only when inserting)
+            mission_id: Mission UUID
+            interested: Number of interested contacts
+            heared: Number of contacts who heard
+            saved: Number of saved contacts
+            
+        Returns:
+            The inserted or updated OutreachNumbers instance
+        """
+        stmt = insert(OutreachNumbers).values(
+            account_id=account_id,
+            mission_id=mission_id,
+            interested=interested,
+            heared=heared,
+            saved=saved
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OutreachNumbers.mission_id],
+            set_={
+                "interested": stmt.excluded.interested,
+                "heared": stmt.excluded.heared,
+                "saved": stmt.excluded.saved,
+                "deleted_at": None,
+                "updated_at": func.now(),
+            }
+        ).returning(OutreachNumbers)
+        
+        # populate_existing refreshes an instance already in the identity map
+        result = await self.db.execute(stmt, execution_options={"populate_existing": True})
+        return result.scalar_one()
+    
     async def get_by_account(
         self,
-        account_id: UUID | str,
+        account_id: UUID,
         skip: int = 0,
         limit: int = 100
     ) -> List[OutreachNumbers]:
         """Get outreach numbers for an account."""
-        if isinstance(account_id, str):
-            try:
-                account_id = UUID(account_id)
-            except ValueError:
-                return []
-        
         stmt = (
             select(OutreachNumbers)
+            .options(raiseload("*"))
             .where(and_(OutreachNumbers.account_id == account_id, OutreachNumbers.deleted_at.is_(None)))
             .offset(skip)
             .limit(limit)
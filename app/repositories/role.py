@@ -4,14 +4,23 @@ Role Repository
 Repository for role database operations.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.models.role import Role
 from app.repositories.base import BaseRepository
 
+# role name -> role ID. Roles are a fixed global seed set whose IDs never
+# change once committed, so lookups are served from here after the first
+_role_id_cache: Dict[str, UUID] = {}
+
+# Built once so each lookup reuses the statement's memoized cache key
+_GET_ROLE_BY_NAME = select(Role).where(Role.name == bindparam("name"))
+_GET_ROLE_ID_BY_NAME = select(Role.id).where(Role.name == bindparam("name"))
+
 
 class RoleRepository(BaseRepository[Role]):
     """Repository for Role model operations."""
@@ -29,21 +38,52 @@ class RoleRepository(BaseRepository[Role]):
         Returns:
             Role instance or None if not found
         """
-        stmt = select(Role).where(Role.name == name)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_GET_ROLE_BY_NAME, {"name": name})
         return result.scalar_one_or_none()
+    
+    async def get_id_by_name(self, name: str) -> Optional[UUID]:
+        """
+        Get a role's ID by name, without loading the role.
+        
+        Cached per process; only the first lookup of a name hits the database.
+        
+        Args:
+            name: Role name
+            
+        Returns:
+            Role UUID or None if not found
+        """
+        role_id = _role_id_cache.get(name)
+        if role_id is not None:
+            return role_id
+        
+        result = await self.db.execute(_GET_ROLE_ID_BY_NAME, {"name": name})
+        role_id = result.scalar_one_or_none()
+        
+        # Roles seeded by this (uncommitted) transaction could still roll back
+        if role_id is not None and not self.db.info.get("roles_seeded"):
+            _role_id_cache[name] = role_id
+        return role_id
 
     async def ensure_default_roles(self):
         """
         Ensure default roles exist in the database.
         Seed: owner, admin, member, missionary, evangelist
+        
+        One INSERT ... ON CONFLICT (name) DO NOTHING covers all of them;
+        existing roles are left untouched.
         """
         default_roles = ["owner", "admin", "member", "missionary", "evangelist"]
-        for role_name in default_roles:
-            role = await self.get_by_name(role_name)
-            if not role:
-                await self.create(
-                    name=role_name,
-                    description=f"Global {role_name} role"
-                )
+        stmt = insert(Role).values([
+            {"name": role_name, "description": f"Global {role_name} role"}
+            for role_name in default_roles
+        ]).on_conflict_do_nothing(index_elements=[Role.name])
+        result = await self.db.execute(stmt)
+        if result.rowcount:
+            self.db.info["roles_seeded"] = True
+    
+    async def delete(self, id: UUID) -> bool:
+        """Delete a role and drop the cached role IDs."""
+        _role_id_cache.clear()
+        return await super().delete(id)
 # Removed account specific methods
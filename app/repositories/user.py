@@ -4,14 +4,30 @@ User Repository
 Repository for user database operations.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy import bindparam, exists, func, select
 
 from app.models.user import User
 from app.repositories.base import BaseRepository
 
+# Emails match case-insensitively. The expression mirrors the
+# ix_users_email_lower index (lower(email) COLLATE "C"), so lookups are
+# index scans comparing bytes rather than going through the collation.
+_EMAIL_KEY = func.lower(User.email).collate("C")
+
+
+def email_equals(email) -> ColumnElement[bool]:
+    """Case-insensitive, index-backed match of User.email against a value."""
+    return _EMAIL_KEY == func.lower(email)
+
+
+# Built once so each lookup reuses the statement's memoized cache key
+_GET_USER_BY_EMAIL = select(User).where(email_equals(bindparam("email")))
+_GET_USER_ID_BY_EMAIL = select(User.id).where(email_equals(bindparam("email")))
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User model operations."""
@@ -21,7 +37,7 @@ class UserRepository(BaseRepository[User]):
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """
-        Get user by email address.
+        Get user by email address (case-insensitive).
         
         Args:
             email: User's email address
@@ -29,13 +45,44 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        stmt = select(User).where(User.email == email)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_GET_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
+    async def get_id_by_email(self, email: str) -> Optional[UUID]:
+        """
+        Get a user's ID by email address (case-insensitive), without
+        loading the user.
+        
+        Args:
+            email: User's email address
+            
+        Returns:
+            User UUID or None if not found
+        """
+        result = await self.db.execute(_GET_USER_ID_BY_EMAIL, {"email": email})
+        return result.scalar_one_or_none()
+    
+    async def get_ids_by_emails(self, emails: Iterable[str]) -> Dict[str, UUID]:
+        """
+        Get the IDs of many users by email address in one query.
+        
+        Args:
+            emails: Email addresses
+            
+        Returns:
+            Dictionary of lowercased email -> user UUID for the users found
+        """
+        emails = {email.lower() for email in emails}
+        if not emails:
+            return {}
+        
+        stmt = select(_EMAIL_KEY, User.id).where(_EMAIL_KEY.in_(emails))
+        result = await self.db.execute(stmt)
+        return dict(result.tuples().all())
+    
     async def email_exists(self, email: str, exclude_id: Optional[UUID] = None) -> bool:
         """
-        Check if email already exists.
+        Check if email already exists (case-insensitive).
         
         Args:
             email: Email address to check
@@ -44,13 +91,14 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if email exists, False otherwise
         """
-        stmt = select(User).where(User.email == email)
+        condition = exists().where(email_equals(email))
         
         if exclude_id:
-            stmt = stmt.where(User.id != exclude_id)
+            condition = condition.where(User.id != exclude_id)
         
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        # SELECT EXISTS (...): no row data, stops at the first match
+        result = await self.db.execute(select(condition))
+        return bool(result.scalar())
     
     async def create_user(
         self,
@@ -82,6 +130,5 @@ class UserRepository(BaseRepository[User]):
         )
         self.db.add(user)
         await self.db.flush()
-        await self.db.refresh(user)
         return user
 
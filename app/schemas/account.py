@@ -1,5 +1,6 @@
 from typing import Optional
-from pydantic import BaseModel, UUID4, EmailStr
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 class AccountCreate(BaseModel):
     account_name: str
@@ -8,20 +9,23 @@ class AccountCreate(BaseModel):
     location: Optional[str] = None
 
 class AccountResponse(BaseModel):
-    id: UUID4
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
     account_name: str
     email: Optional[EmailStr] = None
     phone_number: Optional[str] = None
     location: Optional[str] = None
     is_active: bool
-    created_by: UUID4
+    created_by: UUID
 
-    class Config:
-        from_attributes = True
+class AccountMembershipResponse(AccountResponse):
+    """Account the current user belongs to, with their role in it."""
+    role_id: UUID
 
 class AccountJoinRequest(BaseModel):
     # Depending on how we identify the account. Usually by ID or name?
     # Requirement: "Request to join an existing account."
     # Ideally by ID? Or maybe by Invite Code?
     # I'll stick to ID for now, as search is separate.
-    account_id: UUID4
+    account_id: UUID
@@ -5,6 +5,8 @@ Pydantic models for authentication requests and responses.
 """
 
 from typing import Optional
+from datetime import datetime
+from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 
@@ -26,7 +28,15 @@ class UserLogin(BaseModel):
     """User login request schema."""
     model_config = ConfigDict(from_attributes=True)
     
-    email: EmailStr = Field(..., description="User's email address")
+    # Plain string with a cheap shape check: full EmailStr validation runs
+    # on every login attempt, and a malformed address simply fails to match
+    # a user. Registration keeps EmailStr.
+    email: str = Field(
+        ...,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+$",
+        description="User's email address"
+    )
     password: str = Field(..., description="User password")
     account_id: Optional[str] = Field(None, description="Optional: Account ID to login directly into")
 
@@ -38,6 +48,13 @@ class TokenRefresh(BaseModel):
     refresh_token: str = Field(..., description="Refresh token")
 
 
+class LogoutRequest(BaseModel):
+    """Logout request schema."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    refresh_token: Optional[str] = Field(None, description="Refresh token to revoke along with the access token")
+
+
 # ----------------------------------------------------
 # Response Schemas
 # ----------------------------------------------------
@@ -59,24 +76,30 @@ class UserResponse(BaseModel):
     """User response schema (without sensitive data)."""
     model_config = ConfigDict(from_attributes=True)
     
-    id: str = Field(..., description="User UUID")
+    id: UUID = Field(..., description="User UUID")
     full_name: str = Field(..., description="User's full name")
     email: EmailStr = Field(..., description="User's email address")
     phone_number: Optional[str] = Field(None, description="User's phone number")
     is_active: bool = Field(..., description="User account active status")
-    created_at: str = Field(..., description="Account creation timestamp")
+    created_at: datetime = Field(..., description="Account creation timestamp")
     
     @classmethod
     def from_user(cls, user: "User") -> "UserResponse":
-        """Create UserResponse from User model."""
-        from datetime import datetime
-        return cls(
-            id=str(user.id),
+        """
+        Create UserResponse from User model.
+        
+        Uses model_construct to skip validation (notably the EmailStr
+        check); the values come straight from a persisted User row and
+        already satisfy the schema. The UUID and datetime are turned into
+        strings only when the response is serialized.
+        """
+        return cls.model_construct(
+            id=user.id,
             full_name=user.full_name,
             email=user.email,
             phone_number=user.phone_number,
             is_active=user.is_active,
-            created_at=user.created_at.isoformat() if user.created_at else datetime.utcnow().isoformat()
+            created_at=user.created_at
         )
 
 
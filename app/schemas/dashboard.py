@@ -5,7 +5,7 @@ Pydantic models for dashboard-related responses.
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MissionMapItem(BaseModel):
@@ -36,7 +36,7 @@ class ExpenseSummary(BaseModel):
     total_amount: float = 0.0
     total_budget: float = 0.0
     budget_utilization: float = 0.0
-    by_category: Dict[str, float] = {}
+    by_category: Dict[str, float] = Field(default_factory=dict)
 
 
 class DashboardStats(BaseModel):
@@ -46,15 +46,15 @@ class DashboardStats(BaseModel):
     total_missions: int = 0
     active_missions: int = 0
     total_evangelists: int = 0
-    outreach: OutreachSummary = OutreachSummary()
-    expenses: ExpenseSummary = ExpenseSummary()
+    outreach: OutreachSummary = Field(default_factory=OutreachSummary)
+    expenses: ExpenseSummary = Field(default_factory=ExpenseSummary)
 
 
 class DashboardMapResponse(BaseModel):
     """Map data response with mission locations."""
     model_config = ConfigDict(from_attributes=True)
     
-    missions: List[MissionMapItem] = []
+    missions: List[MissionMapItem] = Field(default_factory=list)
 
 
 class DashboardSummaryResponse(BaseModel):
@@ -62,4 +62,4 @@ class DashboardSummaryResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     stats: DashboardStats
-    missions: List[MissionMapItem] = []
+    missions: List[MissionMapItem] = Field(default_factory=list)
@@ -6,6 +6,7 @@ Pydantic models for mission-related requests and responses.
 
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict, field_validator, EmailStr
 
 class MissionAssignment(BaseModel):
@@ -16,7 +17,7 @@ class MissionCreate(BaseModel):
     """Mission creation schema."""
     model_config = ConfigDict(from_attributes=True)
     
-    account_id: str = Field(..., description="Account UUID")
+    account_id: UUID = Field(..., description="Account UUID")
     name: str = Field(..., min_length=1, max_length=255, description="Mission name")
     start_date: Optional[datetime] = Field(None, description="Mission start date")
     end_date: Optional[datetime] = Field(None, description="Mission end date")
@@ -50,32 +51,25 @@ class MissionResponse(BaseModel):
     """Mission response schema."""
     model_config = ConfigDict(from_attributes=True)
     
-    id: str
-    account_id: str
+    id: UUID
+    account_id: UUID
     name: str
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     location: Optional[Dict[str, Any]] = None
     budget: Optional[float] = None
-    created_by: str
-    deleted_at: Optional[str] = None
-    created_at: str
-    updated_at: str
+    created_by: UUID
+    deleted_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
     
     @classmethod
     def from_mission(cls, mission):
-        """Create MissionResponse from Mission model."""
-        return cls(
-            id=str(mission.id),
-            account_id=str(mission.account_id),
-            name=mission.name,
-            start_date=mission.start_date.isoformat() if mission.start_date else None,
-            end_date=mission.end_date.isoformat() if mission.end_date else None,
-            location=mission.location,
-            budget=mission.budget,
-            created_by=str(mission.created_by),
-            deleted_at=mission.deleted_at.isoformat() if mission.deleted_at else None,
-            created_at=mission.created_at.isoformat() if mission.created_at else "",
-            updated_at=mission.updated_at.isoformat() if mission.updated_at else ""
-        )
+        """
+        Create MissionResponse from Mission model.
+        
+        Attributes are read and checked by pydantic-core; UUIDs and datetimes
+        are turned into strings only when the response is serialized.
+        """
+        return cls.model_validate(mission)
 
@@ -55,14 +55,14 @@ class AccountService:
         
         self.db.add(account)
         await self.db.flush()
-        await self.db.refresh(account)
         
-        # Ensure default roles exist
-        await self.role_repo.ensure_default_roles()
-        
-        # Get owner role
-        owner_role = await self.role_repo.get_by_name("owner")
-        if not owner_role:
+        # Get owner role (cached per process); seed the default roles only
+        # if they are missing
+        owner_role_id = await self.role_repo.get_id_by_name("owner")
+        if not owner_role_id:
+            await self.role_repo.ensure_default_roles()
+            owner_role_id = await self.role_repo.get_id_by_name("owner")
+        if not owner_role_id:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Owner role not found"
@@ -72,12 +72,11 @@ class AccountService:
         await self.account_user_repo.create(
             account_id=account.id,
             user_id=current_user.id,
-            role_id=owner_role.id
+            role_id=owner_role_id
         )
         
         # Commit transaction
         await self.db.commit()
-        await self.db.refresh(account)
         
         return AccountResponse.model_validate(account)
 
@@ -91,7 +90,7 @@ class AccountService:
         Returns:
             Account response
         """
-        account = await self.account_repo.get_by_id(str(account_id))
+        account = await self.account_repo.get_by_id(account_id)
         if not account:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -102,7 +101,7 @@ class AccountService:
     
     async def get_user_accounts(self, user_id: UUID) -> List[dict]:
         """
-        Get all accounts a user belongs to.
+        Get all active accounts a user belongs to.
         
         Args:
             user_id: User UUID
@@ -110,24 +109,22 @@ class AccountService:
         Returns:
             List of account information with role
         """
-        account_users = await self.account_user_repo.get_by_user_id(str(user_id))
-        
-        result = []
-        for au in account_users:
-            account = await self.account_repo.get_by_id(str(au.account_id))
-            if account and account.is_active:
-                result.append({
-                    "id": str(account.id),
-                    "account_name": account.account_name,
-                    "email": account.email,
-                    "phone_number": account.phone_number,
-                    "location": account.location,
-                    "is_active": account.is_active,
-                    "created_by": str(account.created_by),
-                    "role_id": str(au.role_id)
-                })
-        
-        return result
+        # Memberships and their accounts in a single JOIN
+        memberships = await self.account_repo.get_memberships_for_user(user_id)
+        
+        return [
+            {
+                "id": account.id,
+                "account_name": account.account_name,
+                "email": account.email,
+                "phone_number": account.phone_number,
+                "location": account.location,
+                "is_active": account.is_active,
+                "created_by": account.created_by,
+                "role_id": role_id
+            }
+            for account, role_id in memberships
+        ]
     
     async def request_join_account(self, current_user: User, account_id: UUID) -> None:
         """
@@ -141,7 +138,7 @@ class AccountService:
             HTTPException: If account not found or user already member
         """
         # Check if account exists
-        account = await self.account_repo.get_by_id(str(account_id))
+        account = await self.account_repo.get_by_id(account_id)
         if not account:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -154,32 +151,26 @@ class AccountService:
                 detail="Account is not active"
             )
         
-        # Check if user is already a member
-        existing = await self.account_user_repo.get_by_user_and_account(
-            user_id=str(current_user.id),
-            account_id=str(account_id)
-        )
-        
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You are already a member of this account"
-            )
-        
         # Get member role (default for join requests)
-        member_role = await self.role_repo.get_by_name("member")
-        if not member_role:
+        member_role_id = await self.role_repo.get_id_by_name("member")
+        if not member_role_id:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Member role not found"
             )
         
-        # Create account-user relationship
+        # Create account-user relationship unless the user is already a member
         # Note: In a real app, this might create a pending invitation instead
-        await self.account_user_repo.create(
+        created = await self.account_user_repo.create_if_absent(
             account_id=account_id,
             user_id=current_user.id,
-            role_id=member_role.id
+            role_id=member_role_id
         )
         
+        if not created:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You are already a member of this account"
+            )
+        
         await self.db.commit()
@@ -5,16 +5,21 @@ Business logic for authentication operations.
 """
 
 from typing import Optional
+from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import is_token_revoked
 from app.core.security import (
-    hash_password,
-    verify_password,
-    create_token_pair
+    hash_password_async,
+    verify_password_async,
+    create_token_pair,
+    create_access_token,
+    decode_token,
+    token_fingerprint,
+    verify_token_type
 )
 from app.repositories.user import UserRepository
-from app.repositories.account_user import AccountUserRepository
 from app.repositories.account import AccountRepository
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin
@@ -54,7 +59,7 @@ class AuthService:
             )
         
         # Hash password
-        password_hash = hash_password(user_data.password)
+        password_hash = await hash_password_async(user_data.password)
         
         # Create user
         user = await self.user_repo.create_user(
@@ -67,7 +72,6 @@ class AuthService:
         
         # Commit transaction
         await self.db.commit()
-        await self.db.refresh(user)
         
         # Create tokens with no account_id initially
         tokens = create_token_pair(
@@ -95,6 +99,8 @@ class AuthService:
         user = await self.user_repo.get_by_email(login_data.email)
         
         if not user:
+            # Spend the same bcrypt time as a wrong password
+            await verify_password_async(login_data.password, "")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
@@ -102,7 +108,7 @@ class AuthService:
             )
         
         # Verify password
-        if not verify_password(login_data.password, user.password_hash):
+        if not await verify_password_async(login_data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
@@ -116,21 +122,12 @@ class AuthService:
                 detail="User account is inactive"
             )
         
-        # Get user's accounts
-        account_user_repo = AccountUserRepository(self.db)
-        account_users = await account_user_repo.get_by_user_id(str(user.id))
-        
-        # Prepare available accounts list
-        available_accounts = []
-        # Get account details for each association (assuming eager load or separate query)
+        # Get user's active accounts (single JOIN over account_users)
         account_repo = AccountRepository(self.db)
-        for au in account_users:
-            acc = await account_repo.get_by_id(au.account_id)
-            if acc and acc.is_active:
-                available_accounts.append({
-                    "id": str(acc.id),
-                    "name": acc.account_name
-                })
+        available_accounts = [
+            {"id": str(acc.id), "name": acc.account_name}
+            for acc in await account_repo.get_active_for_user(user.id)
+        ]
         
         # Determine account context
         account_id = None
@@ -170,10 +167,8 @@ class AuthService:
             New token dict with access_token
             
         Raises:
-            HTTPException: If refresh token is invalid
+            HTTPException: If refresh token is invalid or was revoked by logout
         """
-        from app.core.security import decode_token, verify_token_type, create_access_token
-        
         # Verify token type
         if not verify_token_type(refresh_token, "refresh"):
             raise HTTPException(
@@ -182,6 +177,13 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
+        if await is_token_revoked(token_fingerprint(refresh_token)):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
         # Decode token
         try:
             payload = decode_token(refresh_token)
@@ -196,7 +198,7 @@ class AuthService:
                 )
             
             # Verify user still exists and is active
-            user = await self.user_repo.get_by_id(user_id)
+            user = await self.user_repo.get_by_id(UUID(user_id))
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -231,10 +233,10 @@ class AuthService:
             
         except HTTPException:
             raise
-        except Exception as e:
+        except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=f"Invalid refresh token: {str(e)}",
+                detail="Invalid refresh token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
@@ -33,13 +33,11 @@ class DashboardService:
         self.db = db
         self.mission_repo = MissionRepository(db)
     
-    async def get_dashboard_stats(self, account_id: str) -> DashboardStats:
+    async def get_dashboard_stats(self, account_id: UUID) -> DashboardStats:
         """Get aggregated dashboard statistics for an account."""
-        account_uuid = UUID(account_id)
-        
         # Count total and active missions
         total_missions_query = select(func.count(Mission.id)).where(
-            Mission.account_id == account_uuid,
+            Mission.account_id == account_id,
             Mission.deleted_at.is_(None)
         )
         total_missions_result = await self.db.execute(total_missions_query)
@@ -48,7 +46,7 @@ class DashboardService:
         # Active missions (started and not ended)
         now = datetime.now(timezone.utc)
         active_missions_query = select(func.count(Mission.id)).where(
-            Mission.account_id == account_uuid,
+            Mission.account_id == account_id,
             Mission.deleted_at.is_(None),
             Mission.start_date <= now,
             (Mission.end_date.is_(None) | (Mission.end_date >= now))
@@ -60,7 +58,7 @@ class DashboardService:
         evangelists_query = select(func.count(func.distinct(MissionUser.user_id))).join(
             Mission, MissionUser.mission_id == Mission.id
         ).where(
-            Mission.account_id == account_uuid,
+            Mission.account_id == account_id,
             Mission.deleted_at.is_(None)
         )
         evangelists_result = await self.db.execute(evangelists_query)
@@ -72,7 +70,7 @@ class DashboardService:
             func.coalesce(func.sum(OutreachNumbers.heared), 0).label('heared'),
             func.coalesce(func.sum(OutreachNumbers.saved), 0).label('saved')
         ).where(
-            OutreachNumbers.account_id == account_uuid,
+            OutreachNumbers.account_id == account_id,
             OutreachNumbers.deleted_at.is_(None)
         )
         outreach_result = await self.db.execute(outreach_query)
@@ -80,7 +78,7 @@ class DashboardService:
         
         # Count total contacts from outreach data
         contacts_query = select(func.count(OutreachData.id)).where(
-            OutreachData.account_id == account_uuid,
+            OutreachData.account_id == account_id,
             OutreachData.deleted_at.is_(None)
         )
         contacts_result = await self.db.execute(contacts_query)
@@ -97,7 +95,7 @@ class DashboardService:
         expense_query = select(
             func.coalesce(func.sum(Expense.amount), 0).label('total')
         ).where(
-            Expense.account_id == account_uuid,
+            Expense.account_id == account_id,
             Expense.deleted_at.is_(None)
         )
         expense_result = await self.db.execute(expense_query)
@@ -107,7 +105,7 @@ class DashboardService:
         budget_query = select(
             func.coalesce(func.sum(Mission.budget), 0)
         ).where(
-            Mission.account_id == account_uuid,
+            Mission.account_id == account_id,
             Mission.deleted_at.is_(None)
         )
         budget_result = await self.db.execute(budget_query)
@@ -121,7 +119,7 @@ class DashboardService:
             Expense.category,
             func.sum(Expense.amount).label('amount')
         ).where(
-            Expense.account_id == account_uuid,
+            Expense.account_id == account_id,
             Expense.deleted_at.is_(None)
         ).group_by(Expense.category)
         category_result = await self.db.execute(category_query)
@@ -142,16 +140,14 @@ class DashboardService:
             expenses=expense_summary
         )
     
-    async def get_map_data(self, account_id: str) -> DashboardMapResponse:
+    async def get_map_data(self, account_id: UUID) -> DashboardMapResponse:
         """Get mission locations for map visualization."""
-        account_uuid = UUID(account_id)
-        
         # Get missions with their outreach numbers and expenses
         missions_query = select(Mission).options(
             selectinload(Mission.outreach_numbers),
             selectinload(Mission.expenses)
         ).where(
-            Mission.account_id == account_uuid,
+            Mission.account_id == account_id,
             Mission.deleted_at.is_(None),
             Mission.location.isnot(None)
         ).order_by(Mission.created_at.desc())
@@ -189,8 +185,14 @@ class DashboardService:
         
         return DashboardMapResponse(missions=map_items)
     
-    async def get_dashboard_summary(self, account_id: str) -> DashboardSummaryResponse:
-        """Get combined dashboard summary with stats and map data."""
+    async def get_dashboard_summary(self, account_id: UUID) -> DashboardSummaryResponse:
+        """
+        Get combined dashboard summary with stats and map data.
+        
+        Both halves run on the request's session, one after the other, so
+        the summary holds a single pool connection; the response cache
+        absorbs the extra round trip.
+        """
         stats = await self.get_dashboard_stats(account_id)
         map_data = await self.get_map_data(account_id)
         
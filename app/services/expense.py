@@ -4,11 +4,14 @@ Expense Service
 Business logic for expense operations.
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_dashboard_cache
+from app.repositories.base import Cursor
 from app.repositories.expense import ExpenseRepository
 from app.repositories.mission import MissionRepository
 from app.repositories.account import AccountRepository
@@ -29,9 +32,9 @@ class ExpenseService:
     async def create_expense(
         self,
         expense_data: ExpenseCreate,
-        current_user: User
+        user_id: UUID
     ) -> Expense:
-        """Create a new expense."""
+        """Create a new expense recorded by user_id."""
         # Verify account exists
         account = await self.account_repo.get_by_id(expense_data.account_id)
         if not account:
@@ -51,19 +54,19 @@ class ExpenseService:
         
         # Create expense
         expense = await self.expense_repo.create(
-            account_id=UUID(expense_data.account_id),
-            mission_id=UUID(expense_data.mission_id) if expense_data.mission_id else None,
-            user_id=current_user.id,
+            account_id=expense_data.account_id,
+            mission_id=expense_data.mission_id,
+            user_id=user_id,
             category=expense_data.category,
             amount=expense_data.amount,
             description=expense_data.description
         )
         
         await self.db.commit()
-        await self.db.refresh(expense)
+        await invalidate_dashboard_cache(expense.account_id)
         return expense
     
-    async def get_expense(self, expense_id: str) -> Expense:
+    async def get_expense(self, expense_id: UUID) -> Expense:
         """Get expense by ID."""
         expense = await self.expense_repo.get_by_id(expense_id)
         if not expense:
@@ -75,16 +78,17 @@ class ExpenseService:
     
     async def get_expenses_by_mission(
         self,
-        mission_id: str,
+        mission_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Cursor] = None
     ) -> List[Expense]:
         """Get expenses for a mission."""
-        return await self.expense_repo.get_by_mission(mission_id, skip, limit)
+        return await self.expense_repo.get_by_mission(mission_id, skip, limit, after=after)
     
     async def update_expense(
         self,
-        expense_id: str,
+        expense_id: UUID,
         expense_data: ExpenseUpdate,
         current_user: User
     ) -> Expense:
@@ -100,17 +104,16 @@ class ExpenseService:
         
         update_data = expense_data.model_dump(exclude_unset=True)
         if "deleted_at" in update_data and update_data["deleted_at"]:
-            from datetime import datetime
             update_data["deleted_at"] = datetime.fromisoformat(update_data["deleted_at"].replace("Z", "+00:00"))
         
         updated_expense = await self.expense_repo.update(expense_id, **update_data)
         await self.db.commit()
-        await self.db.refresh(updated_expense)
+        await invalidate_dashboard_cache(updated_expense.account_id)
         return updated_expense
     
     async def delete_expense(
         self,
-        expense_id: str,
+        expense_id: UUID,
         current_user: User
     ) -> bool:
         """Soft delete an expense."""
@@ -122,8 +125,8 @@ class ExpenseService:
                 detail="Not authorized to delete this expense"
             )
         
-        from datetime import datetime, timezone
-        await self.expense_repo.update(expense_id, deleted_at=datetime.now(timezone.utc))
+        await self.expense_repo.delete(expense_id)
         await self.db.commit()
+        await invalidate_dashboard_cache(expense.account_id)
         return True
 
@@ -4,23 +4,36 @@ Mission Service
 Business logic for mission operations.
 """
 
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.cache import invalidate_dashboard_cache
+from app.repositories.base import Cursor
 from app.repositories.mission import MissionRepository
 from app.repositories.account import AccountRepository
 from app.repositories.user import UserRepository
 from app.repositories.mission_user import MissionUserRepository
 from app.repositories.account_user import AccountUserRepository
 from app.repositories.role import RoleRepository
+from app.models.account_user import AccountUser
 from app.models.mission import Mission
 from app.models.user import User
 from app.models.mission_user import MissionRole
 from app.schemas.mission import MissionCreate, MissionUpdate
 from app.utils.email import send_invitation_email
 
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Make a naive datetime UTC-aware (as asyncpg stores it) for comparisons."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 class MissionService:
     """Service for mission operations."""
     
@@ -33,20 +46,6 @@ class MissionService:
         self.account_user_repo = AccountUserRepository(db)
         self.role_repo = RoleRepository(db)
     
-    async def create_mission(
-        self,
-        mission_data: MissionCreate,
-        current_user: User
-    ) -> Mission:
-        """Create a new mission and handle assignments."""
-        # Verify account exists and user has access
-        account = await self.account_repo.get_by_id(mission_data.account_id)
-        if not account:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Account not found"
-            )
-        
     async def create_mission(
         self,
         mission_data: MissionCreate,
@@ -63,9 +62,11 @@ class MissionService:
         
         # Verify user has admin role in the account
         # Requirement: "Only admin can create mission"
+        # Membership and role in one query
         account_user = await self.account_user_repo.get_by_user_and_account(
             current_user.id, 
-            account.id
+            account.id,
+            options=(joinedload(AccountUser.role),)
         )
         
         if not account_user:
@@ -74,7 +75,7 @@ class MissionService:
                 detail="You are not a member of this account"
             )
             
-        role = await self.role_repo.get_by_id(account_user.role_id)
+        role = account_user.role
         # Check for admin OR owner
         if not role or role.name not in ["admin", "owner"]:
             raise HTTPException(
@@ -84,7 +85,7 @@ class MissionService:
              
         # Create mission
         mission = await self.mission_repo.create(
-            account_id=UUID(mission_data.account_id),
+            account_id=mission_data.account_id,
             name=mission_data.name,
             start_date=mission_data.start_date,
             end_date=mission_data.end_date,
@@ -93,11 +94,15 @@ class MissionService:
             created_by=current_user.id
         )
         
-        # Process assignments
+        # Process assignments (one user lookup and one insert for all of them)
         if mission_data.assignments:
+            user_ids = await self.user_repo.get_ids_by_emails(
+                assignment.email for assignment in mission_data.assignments
+            )
+            mission_users = []
             for assignment in mission_data.assignments:
-                user = await self.user_repo.get_by_email(assignment.email)
-                if user:
+                user_id = user_ids.get(assignment.email.lower())
+                if user_id:
                     # Assign directly
                     try:
                         role_enum = MissionRole(assignment.role.lower())
@@ -105,11 +110,11 @@ class MissionService:
                         # Fallback or skip
                         continue
 
-                    await self.mission_user_repo.create(
-                        mission_id=mission.id,
-                        user_id=user.id,
-                        role=role_enum
-                    )
+                    mission_users.append({
+                        "mission_id": mission.id,
+                        "user_id": user_id,
+                        "role": role_enum
+                    })
                 else:
                     # Send Email Invitation
                     send_invitation_email(
@@ -117,11 +122,14 @@ class MissionService:
                         mission_name=mission.name,
                         role=assignment.role
                     )
+            
+            await self.mission_user_repo.create_many(mission_users)
 
         await self.db.commit()
-        await self.db.refresh(mission)
+        await invalidate_dashboard_cache(mission.account_id)
         return mission
-    async def get_mission(self, mission_id: str) -> Mission:
+    
+    async def get_mission(self, mission_id: UUID) -> Mission:
         """Get mission by ID."""
         mission = await self.mission_repo.get_by_id(mission_id)
         if not mission:
@@ -133,16 +141,17 @@ class MissionService:
     
     async def get_missions_by_account(
         self,
-        account_id: str,
+        account_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Cursor] = None
     ) -> List[Mission]:
         """Get missions for an account."""
-        return await self.mission_repo.get_by_account(account_id, skip, limit)
+        return await self.mission_repo.get_by_account(account_id, skip, limit, after=after)
     
     async def update_mission(
         self,
-        mission_id: str,
+        mission_id: UUID,
         mission_data: MissionUpdate,
         current_user: User
     ) -> Mission:
@@ -155,19 +164,28 @@ class MissionService:
             pass
         
         # Update mission
+        # deleted_at is already parsed into a datetime by MissionUpdate
         update_data = mission_data.model_dump(exclude_unset=True)
-        if "deleted_at" in update_data and update_data["deleted_at"]:
-            from datetime import datetime
-            update_data["deleted_at"] = datetime.fromisoformat(update_data["deleted_at"].replace("Z", "+00:00"))
+        
+        # Check the dates as they will be stored (unset or None fields keep
+        # their current value), mirroring the missions_date_range constraint.
+        # Stored dates are aware; naive input is taken as UTC.
+        start_date = _as_utc(update_data.get("start_date") or mission.start_date)
+        end_date = _as_utc(update_data.get("end_date") or mission.end_date)
+        if start_date and end_date and end_date < start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date must be after start_date"
+            )
         
         updated_mission = await self.mission_repo.update(mission_id, **update_data)
         await self.db.commit()
-        await self.db.refresh(updated_mission)
+        await invalidate_dashboard_cache(updated_mission.account_id)
         return updated_mission
     
     async def delete_mission(
         self,
-        mission_id: str,
+        mission_id: UUID,
         current_user: User
     ) -> bool:
         """Soft delete a mission."""
@@ -180,8 +198,8 @@ class MissionService:
                 detail="Not authorized to delete this mission"
             )
         
-        from datetime import datetime, timezone
-        await self.mission_repo.update(mission_id, deleted_at=datetime.now(timezone.utc))
+        await self.mission_repo.delete(mission_id)
         await self.db.commit()
+        await invalidate_dashboard_cache(mission.account_id)
         return True
 
@@ -4,11 +4,14 @@ Outreach Service
 Business logic for outreach operations.
 """
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_dashboard_cache
+from app.repositories.base import Cursor
 from app.repositories.outreach import OutreachDataRepository, OutreachNumbersRepository
 from app.repositories.mission import MissionRepository
 from app.repositories.account import AccountRepository
@@ -17,8 +20,7 @@ from app.models.user import User
 from app.schemas.outreach import (
     OutreachDataCreate,
     OutreachDataUpdate,
-    OutreachNumbersCreate,
-    OutreachNumbersUpdate
+    OutreachNumbersCreate
 )
 
 
@@ -49,8 +51,8 @@ class OutreachService:
         
         # Create outreach data
         data = await self.outreach_data_repo.create(
-            account_id=UUID(outreach_data.account_id),
-            mission_id=UUID(outreach_data.mission_id),
+            account_id=outreach_data.account_id,
+            mission_id=outreach_data.mission_id,
             full_name=outreach_data.full_name,
             phone_number=outreach_data.phone_number,
             status=outreach_data.status,
@@ -58,10 +60,10 @@ class OutreachService:
         )
         
         await self.db.commit()
-        await self.db.refresh(data)
+        await invalidate_dashboard_cache(data.account_id)
         return data
     
-    async def get_outreach_data(self, data_id: str) -> OutreachData:
+    async def get_outreach_data(self, data_id: UUID) -> OutreachData:
         """Get outreach data by ID."""
         data = await self.outreach_data_repo.get_by_id(data_id)
         if not data:
@@ -73,16 +75,17 @@ class OutreachService:
     
     async def get_outreach_data_by_mission(
         self,
-        mission_id: str,
+        mission_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Cursor] = None
     ) -> List[OutreachData]:
         """Get outreach data for a mission."""
-        return await self.outreach_data_repo.get_by_mission(mission_id, skip, limit)
+        return await self.outreach_data_repo.get_by_mission(mission_id, skip, limit, after=after)
     
     async def update_outreach_data(
         self,
-        data_id: str,
+        data_id: UUID,
         update_data: OutreachDataUpdate,
         current_user: User
     ) -> OutreachData:
@@ -98,12 +101,11 @@ class OutreachService:
         
         update_dict = update_data.model_dump(exclude_unset=True)
         if "deleted_at" in update_dict and update_dict["deleted_at"]:
-            from datetime import datetime
             update_dict["deleted_at"] = datetime.fromisoformat(update_dict["deleted_at"].replace("Z", "+00:00"))
         
         updated = await self.outreach_data_repo.update(data_id, **update_dict)
         await self.db.commit()
-        await self.db.refresh(updated)
+        await invalidate_dashboard_cache(updated.account_id)
         return updated
     
     # Outreach Numbers methods
@@ -111,36 +113,19 @@ class OutreachService:
         self,
         numbers_data: OutreachNumbersCreate
     ) -> OutreachNumbers:
-        """Get or create outreach numbers for a mission."""
-        # Check if exists
-        existing = await self.outreach_numbers_repo.get_by_mission(numbers_data.mission_id)
-        
-        if existing:
-            # Update existing
-            update_data = OutreachNumbersUpdate(
-                interested=numbers_data.interested,
-                heared=numbers_data.heared,
-                saved=numbers_data.saved
-            )
-            update_dict = update_data.model_dump(exclude_unset=True)
-            updated = await self.outreach_numbers_repo.update(str(existing.id), **update_dict)
-            await self.db.commit()
-            await self.db.refresh(updated)
-            return updated
-        else:
-            # Create new
-            numbers = await self.outreach_numbers_repo.create(
-                account_id=UUID(numbers_data.account_id),
-                mission_id=UUID(numbers_data.mission_id),
-                interested=numbers_data.interested,
-                heared=numbers_data.heared,
-                saved=numbers_data.saved
-            )
-            await self.db.commit()
-            await self.db.refresh(numbers)
-            return numbers
+        """Create or overwrite the outreach numbers for a mission (single UPSERT)."""
+        numbers = await self.outreach_numbers_repo.upsert_for_mission(
+            account_id=numbers_data.account_id,
+            mission_id=numbers_data.mission_id,
+            interested=numbers_data.interested,
+            heared=numbers_data.heared,
+            saved=numbers_data.saved
+        )
+        await self.db.commit()
+        await invalidate_dashboard_cache(numbers.account_id)
+        return numbers
     
-    async def get_outreach_numbers(self, mission_id: str) -> Optional[OutreachNumbers]:
+    async def get_outreach_numbers(self, mission_id: UUID) -> Optional[OutreachNumbers]:
         """Get outreach numbers for a mission."""
         return await self.outreach_numbers_repo.get_by_mission(mission_id)
 
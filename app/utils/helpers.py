@@ -0,0 +1,57 @@
+"""
+Helper Utilities
+
+Small helpers shared across API routes.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+from starlette.requests import Request
+
+
+# ----------------------------------------------------
+# Keyset Pagination
+# ----------------------------------------------------
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode a row's (created_at, id) as an opaque URL-safe cursor.
+    
+    Example:
+        >>> encode_cursor(mission.created_at, mission.id)
+    """
+    raw = f"{created_at.isoformat()}|{id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor().
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def next_page_headers(request: Request, rows: List[Any], limit: int) -> Dict[str, str]:
+    """
+    Build an RFC 8288 Link header pointing at the page after rows.
+    
+    Returns no headers when rows is shorter than limit (last page). The
+    skip parameter is dropped from the link since the cursor replaces it.
+    """
+    if len(rows) < limit:
+        return {}
+    last = rows[-1]
+    url = request.url.remove_query_params("skip").include_query_params(
+        after=encode_cursor(last.created_at, last.id)
+    )
+    return {"Link": f'<{url}>; rel="next"'}
@@ -0,0 +1,34 @@
+"""
+Production Server Entry Point
+
+Runs the API under uvicorn with uvloop (libuv event loop) and httptools
+(C HTTP parser):
+
+    python run.py
+
+Configured through environment variables:
+- HOST / PORT: bind address (default 0.0.0.0:8000)
+- WEB_CONCURRENCY: worker processes (default: CPU count)
+- LIMIT_CONCURRENCY: max concurrent connections per worker (default 1000)
+
+For development use `uvicorn app.main:app --reload` instead.
+"""
+
+import os
+import sys
+
+import uvicorn
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        # uvloop does not support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "1000")),
+        proxy_headers=True,
+    )
@@ -13,8 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import ssl
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy import select
 
 from app.core.config import settings
@@ -66,9 +65,8 @@ async def seed_database():
     )
     
     # Create session factory
-    async_session = sessionmaker(
+    async_session = async_sessionmaker(
         engine,
-        class_=AsyncSession,
         expire_on_commit=False
     )
     